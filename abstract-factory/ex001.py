@@ -75,8 +75,7 @@ Singletons.
 """
 
 from interface import GUIFactory
-from win import WinFactory
-from mac import MacFactory
+from registry import get_factory
 
 
 def client_code(factory: GUIFactory):
@@ -86,5 +85,5 @@ def client_code(factory: GUIFactory):
     print(checkbox.paint())
 
 
-client_code(WinFactory())
-client_code(MacFactory())
+client_code(get_factory('win'))
+client_code(get_factory('mac'))
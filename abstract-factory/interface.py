@@ -1,23 +1,19 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 
-class GUIFactory(ABC):
-    @abstractmethod
+class GUIFactory(Protocol):
     def create_button(self) -> 'Button':
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
     def create_checkbox(self) -> 'Checkbox':
-        raise NotImplementedError
+        ...
 
 
-class Button(ABC):
-    @abstractmethod
-    def paint(self):
-        pass
+class Button(Protocol):
+    def paint(self) -> str:
+        ...
 
 
-class Checkbox(ABC):
-    @abstractmethod
-    def paint(self):
-        pass
+class Checkbox(Protocol):
+    def paint(self) -> str:
+        ...
@@ -1,19 +1,20 @@
-from interface import GUIFactory, Button, Checkbox
-
-
-class MacFactory(GUIFactory):
+class MacFactory:
     def create_button(self):
-        return MacButton()
+        return _MAC_BUTTON
 
     def create_checkbox(self):
-        return MacCheckbox()
+        return _MAC_CHECKBOX
 
 
-class MacButton(Button):
+class MacButton:
     def paint(self):
         return "Rendering a button in Mac style."
 
 
-class MacCheckbox(Checkbox):
+class MacCheckbox:
     def paint(self):
         return "Rendering a checkbox in Mac style."
+
+
+_MAC_BUTTON = MacButton()
+_MAC_CHECKBOX = MacCheckbox()
@@ -0,0 +1,22 @@
+from functools import lru_cache
+
+from interface import GUIFactory
+
+
+@lru_cache(maxsize=None)
+def get_factory(name: str) -> GUIFactory:
+    """
+    Return the shared factory for a platform. Factories hold no state, so
+    one instance per platform is enough for the whole app. Each platform
+    module is only imported the first time its factory is requested.
+    """
+
+    if name == 'win':
+        from win import WinFactory
+        return WinFactory()
+
+    if name == 'mac':
+        from mac import MacFactory
+        return MacFactory()
+
+    raise ValueError(f"Unknown platform: {name!r}")
@@ -1,19 +1,20 @@
-from interface import GUIFactory, Button, Checkbox
-
-
-class WinFactory(GUIFactory):
+class WinFactory:
     def create_button(self):
-        return WinButton()
+        return _WIN_BUTTON
 
     def create_checkbox(self):
-        return WinCheckbox()
+        return _WIN_CHECKBOX
 
 
-class WinButton(Button):
+class WinButton:
     def paint(self):
         return "Rendering a button in Windows style."
 
 
-class WinCheckbox(Checkbox):
+class WinCheckbox:
     def paint(self):
-        return "Rendering a checkbox in Windows style."
\ No newline at end of file
+        return "Rendering a checkbox in Windows style."
+
+
+_WIN_BUTTON = WinButton()
+_WIN_CHECKBOX = WinCheckbox()
@@ -96,6 +96,8 @@ class Target:
     The Target defines the domain-specific interface used by the client code.
     """
 
+    __slots__ = ()
+
     def request(self) -> str:
         return "Target: The default target's behavior."
 
@@ -107,18 +109,26 @@ class Adaptee:
     needs some adaptation before the client code can use it.
     """
 
+    __slots__ = ()
+
     def specific_request(self) -> str:
         return ".eetpadA eht fo roivaheb laicepS"
 
 
+# The Adaptee's answer never changes, so translate it once up front.
+_TRANSLATED = Adaptee().specific_request()[::-1]
+
+
 class Adapter(Target, Adaptee):
     """
     The Adapter makes the Adaptee's interface compatible with the Target's
     interface via multiple inheritance.
     """
 
+    __slots__ = ()
+
     def request(self) -> str:
-        return f"Adapter: (TRANSLATED) {self.specific_request()[::-1]}"
+        return f"Adapter: (TRANSLATED) {_TRANSLATED}"
 
 
 def client_code(target: "Target") -> None:
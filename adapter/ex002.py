@@ -22,29 +22,38 @@ class FahrenheitTemperatureSensor:
 
 # TODO: Complete the TemperatureSensorAdapter class
 class TemperatureSensorAdapter:
+    __slots__ = ('sensor', '_set', '_get')
+
     def __init__(self, sensor):
         self.sensor = sensor
-        self.sensor_type = type(sensor)
+        self._set = self._make_set(sensor)
+        self._get = self._make_get(sensor)
 
-    def set_temperature(self, temperature):
-        if self.sensor_type == FahrenheitTemperatureSensor:
-            self.sensor.set_temperature(temperature)
+    @staticmethod
+    def _make_set(sensor):
+        if isinstance(sensor, FahrenheitTemperatureSensor):
+            return sensor.set_temperature
+
+        if isinstance(sensor, CelsiusTemperatureSensor):
+            return lambda t: sensor.set_temperature((t - 32) * 5/9)
+
+        raise TypeError(f"Unsupported sensor: {type(sensor).__name__}")
 
-        if self.sensor_type == CelsiusTemperatureSensor:
-            c = (temperature - 32) * 5/9
-            self.sensor.set_temperature(c)
+    @staticmethod
+    def _make_get(sensor):
+        if isinstance(sensor, FahrenheitTemperatureSensor):
+            return lambda: (sensor.get_temperature_fahrenheit() - 32) * 5/9
 
-        raise
+        if isinstance(sensor, CelsiusTemperatureSensor):
+            return sensor.get_temperature_celsius
+
+        raise TypeError(f"Unsupported sensor: {type(sensor).__name__}")
+
+    def set_temperature(self, temperature):
+        self._set(temperature)
 
     def get_temperature_celsius(self):
-        if self.sensor_type == FahrenheitTemperatureSensor:
-            temperature = self.sensor.get_temperature_fahrenheit()
-            fahrenheit = (temperature * 9/5) + 32
-            return fahrenheit
-        if self.sensor_type == CelsiusTemperatureSensor:
-            temperature = self.sensor.get_temperature_celsius()
-            return temperature
-        raise
+        return self._get()
 
 
 def display_temperature(sensor):
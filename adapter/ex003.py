@@ -3,6 +3,8 @@ class Target:
     The Target defines the domain-specific interface used by the client code.
     """
 
+    __slots__ = ()
+
     def request(self) -> str:
         return "Target: The default target's behavior."
 
@@ -14,6 +16,8 @@ class Adaptee:
     needs some adaptation before the client code can use it.
     """
 
+    __slots__ = ()
+
     def specific_request(self) -> str:
         return ".eetpadA eht fo roivaheb laicepS"
 
@@ -24,6 +28,8 @@ class Adapter(Target):
     interface via composition.
     """
 
+    __slots__ = ('adaptee',)
+
     def __init__(self, adaptee: Adaptee) -> None:
         self.adaptee = adaptee
 
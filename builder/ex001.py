@@ -111,46 +111,46 @@ implemented as Singletons.
 """
 
 
-from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional, Protocol
 
 
+@dataclass(slots=True)
 class Computer:
-    def __init__(self):
-        self.processor = None
-        self.memory = None
-        self.storage = None
-        self.graphics_card = None
-        self.operating_system = None
-        self.extras = None
+    processor: Optional[str] = None
+    memory: Optional[str] = None
+    storage: Optional[str] = None
+    graphics_card: Optional[str] = None
+    operating_system: Optional[str] = None
+    extras: Optional[list] = None
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-class ComputerBuilder(ABC):
-    @abstractmethod
+class ComputerBuilder(Protocol):
     def add_processor(self, item):
-        pass
+        ...
 
-    @abstractmethod
     def add_memory(self, item):
-        pass
+        ...
 
-    @abstractmethod
     def add_storage(self, item):
-        pass
+        ...
 
-    @abstractmethod
     def add_graphics_card(self, item):
-        pass
+        ...
 
-    @abstractmethod
     def add_operating_system(self, item):
-        pass
+        ...
 
-    @abstractmethod
     def add_extras(self, item):
-        pass
+        ...
 
 
-class CustomComputerBuilder(ComputerBuilder):
+class CustomComputerBuilder:
+    __slots__ = ('computer',)
+
     def __init__(self):
         self.computer = Computer()
 
@@ -172,18 +172,43 @@ class CustomComputerBuilder(ComputerBuilder):
     def add_extras(self, extras):
         self.computer.extras = extras
 
+    def add_all(self, specs: dict):
+        computer = self.computer
+        (
+            computer.processor,
+            computer.memory,
+            computer.storage,
+            computer.graphics_card,
+            computer.operating_system,
+            computer.extras,
+        ) = (
+            specs['processor'],
+            specs['memory'],
+            specs['storage'],
+            specs['graphics_card'],
+            specs['operating_system'],
+            specs['extras'],
+        )
+
 
 class ComputerDirector:
     def __init__(self, builder: ComputerBuilder):
         self.builder = builder
 
     def build_computer(self, specs: dict):
-        self.builder.add_processor(specs['processor'])
-        self.builder.add_memory(specs['memory'])
-        self.builder.add_storage(specs['storage'])
-        self.builder.add_graphics_card(specs['graphics_card'])
-        self.builder.add_operating_system(specs['operating_system'])
-        self.builder.add_extras(specs['extras'])
+        builder = self.builder
+        # Builders may offer add_all to set every part in one call; the
+        # others are driven through the individual steps.
+        add_all = getattr(builder, 'add_all', None)
+        if add_all is not None:
+            add_all(specs)
+            return
+        builder.add_processor(specs['processor'])
+        builder.add_memory(specs['memory'])
+        builder.add_storage(specs['storage'])
+        builder.add_graphics_card(specs['graphics_card'])
+        builder.add_operating_system(specs['operating_system'])
+        builder.add_extras(specs['extras'])
 
 
 # Helper function to test the computer building process
@@ -193,8 +218,8 @@ def test_computer_building(specs, expected_output):
     director.build_computer(specs)
     computer = builder.computer
     assert (
-        computer.__dict__ == expected_output
-    ), f"Expected {expected_output}, but got {computer.__dict__}"
+        computer.as_dict() == expected_output
+    ), f"Expected {expected_output}, but got {computer.as_dict()}"
 
 
 # Test cases
@@ -1,4 +1,17 @@
+from operator import itemgetter
+from typing import Iterable, List
+
+
 class Computer:
+    __slots__ = (
+        'processor',
+        'memory',
+        'storage',
+        'graphics_card',
+        'operating_system',
+        'extras',
+    )
+
     def __init__(self):
         self.processor = None
         self.memory = None
@@ -7,17 +20,29 @@ class Computer:
         self.operating_system = None
         self.extras = None
 
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+_read_specs = itemgetter(*Computer.__slots__)
+
 
 def build_computer(computer: Computer, specs):
-    computer.processor = specs['processor']
-    computer.memory = specs['memory']
-    computer.storage = specs['storage']
-    computer.graphics_card = specs['graphics_card']
-    computer.operating_system = specs['operating_system']
-    computer.extras = specs['extras']
+    (
+        computer.processor,
+        computer.memory,
+        computer.storage,
+        computer.graphics_card,
+        computer.operating_system,
+        computer.extras,
+    ) = _read_specs(specs)
     return computer
 
 
+def build_computers(specs_list: Iterable[dict]) -> List[Computer]:
+    return [build_computer(Computer(), specs) for specs in specs_list]
+
+
 # Test cases
 test_specs = {
     'processor': 'Intel Core i5',
@@ -40,4 +65,7 @@ expected_output = {
 c1 = Computer()
 c2 = build_computer(c1, test_specs)
 
-assert c2.__dict__ == expected_output
\ No newline at end of file
+assert c2.as_dict() == expected_output
+assert [c.as_dict() for c in build_computers([test_specs] * 3)] == (
+    [expected_output] * 3
+)
\ No newline at end of file
@@ -110,76 +110,194 @@ In addition, decorators aren't allowed to break the flow of the request.
 
 
 from __future__ import annotations
-from abc import ABC, abstractmethod
-from typing import Any, Optional
+import sys
+from typing import Any, Callable, Dict, Iterable, Optional, Protocol, Tuple
 
 
-class Handler(ABC):
+class Handler(Protocol):
     """
     The Handler interface declares a method for building the chain of handlers.
     It also declares a method for executing a request.
     """
 
-    @abstractmethod
     def set_next(self, handler: Handler) -> Handler:
-        pass
+        ...
 
-    @abstractmethod
     def handle(self, request) -> Optional[str]:
-        pass
+        ...
 
 
-class AbstractHandler(Handler):
+class AbstractHandler:
     """
     The default chaining behavior can be implemented inside a base handler
     class.
     """
 
-    _next_handler: Optional[Handler] = None
+    __slots__ = ('_next_handler', '_dispatch', '_chain_version')
+
+    # Bumped on every set_next() so handlers further up the chain know their
+    # cached view of the links is stale.
+    _links_version = 0
+
+    # Concrete handlers react to a single request with a fixed answer; see
+    # _try() and respond().
+    TRIGGER: Optional[str] = None
+    RESPONSE: Optional[str] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Interned triggers let the equality test against an interned request
+        # succeed on the pointer comparison alone.
+        if cls.TRIGGER is not None:
+            cls.TRIGGER = sys.intern(cls.TRIGGER)
+
+    def __init__(self) -> None:
+        self._next_handler: Optional[Handler] = None
+        self._dispatch: Callable[[Any], Optional[str]]
+        self._chain_version = -1
 
     def set_next(self, handler: Handler) -> Handler:
         self._next_handler = handler
+        AbstractHandler._links_version += 1
         # Returning a handler from here will let us link handlers in a
         # convenient way like this:
         # monkey.set_next(squirrel).set_next(dog)
         return handler
 
-    @abstractmethod
+    def _build_chain(
+        self
+    ) -> Tuple[Tuple[AbstractHandler, ...], Optional[Handler]]:
+        """
+        Walk the links once, collecting every AbstractHandler in order. A
+        foreign Handler ends the walk and is delegated to as the tail.
+        """
+
+        handlers = []
+        node: Optional[Handler] = self
+        while isinstance(node, AbstractHandler):
+            handlers.append(node)
+            node = node._next_handler
+
+        return tuple(handlers), node
+
     def handle(self, request: Any) -> Optional[str]:
-        if self._next_handler:
-            return self._next_handler.handle(request)
+        if self._chain_version != AbstractHandler._links_version:
+            self._dispatch = compile_chain(*self._build_chain())
+            self._chain_version = AbstractHandler._links_version
+
+        return self._dispatch(request)
+
+    def _try(self, request: Any) -> Optional[str]:
+        trigger = self.TRIGGER
+        if trigger is not None and request == trigger:
+            return self.respond(request)
 
         return None
 
+    def respond(self, request: Any) -> str:
+        if self.RESPONSE is None:
+            raise NotImplementedError
+
+        return self.RESPONSE
+
+    @staticmethod
+    def build(handlers: Iterable[AbstractHandler]) -> RouterHandler:
+        """
+        Collapse a set of single-trigger handlers into one RouterHandler, so
+        routing a request costs a single dict lookup instead of one
+        comparison per handler.
+        """
+
+        return RouterHandler(handlers)
+
+
+def compile_chain(
+    handlers: Iterable[AbstractHandler],
+    tail: Optional[Handler] = None,
+) -> Callable[[Any], Optional[str]]:
+    """
+    Generate a single function answering for the whole chain: one `if` per
+    handler on its TRIGGER, in chain order, so a request costs one frame
+    instead of one call per hop. Handlers with a custom _try() are called as
+    they are.
+    """
+
+    namespace: Dict[str, Any] = {}
+    lines = ["def _dispatch(request):"]
+    for i, handler in enumerate(handlers):
+        trigger = handler.TRIGGER
+        if type(handler)._try is not AbstractHandler._try:
+            namespace[f"_try{i}"] = handler._try
+            lines.append(f"    result = _try{i}(request)")
+            lines.append("    if result is not None:")
+            lines.append("        return result")
+        elif trigger is not None:
+            lines.append(f"    if request == {sys.intern(trigger)!r}:")
+            if (
+                type(handler).respond is AbstractHandler.respond
+                and handler.RESPONSE is not None
+            ):
+                lines.append(f"        return {handler.RESPONSE!r}")
+            else:
+                namespace[f"_respond{i}"] = handler.respond
+                lines.append(f"        return _respond{i}(request)")
+
+    if tail is not None:
+        namespace["_tail"] = tail.handle
+        lines.append("    return _tail(request)")
+    else:
+        lines.append("    return None")
+
+    exec(compile("\n".join(lines), "<chain>", "exec"), namespace)
+    return namespace["_dispatch"]
+
 
 """
-All Concrete Handlers either handle a request or pass it to the next handler in
-the chain.
+All Concrete Handlers only declare the request they react to and how they
+respond to it; walking the chain is left to AbstractHandler.handle.
 """
 
 
 class MonkeyHandler(AbstractHandler):
-    def handle(self, request: Any) -> Optional[str]:
-        if request == "Banana":
-            return f"Monkey: I'll eat the {request}"
-        else:
-            return super().handle(request)
+    __slots__ = ()
+
+    TRIGGER = "Banana"
+    RESPONSE = "Monkey: I'll eat the Banana"
 
 
 class SquirrelHandler(AbstractHandler):
-    def handle(self, request: Any) -> Optional[str]:
-        if request == "Nut":
-            return f"Squirrel: I'll eat the {request}"
-        else:
-            return super().handle(request)
+    __slots__ = ()
+
+    TRIGGER = "Nut"
+    RESPONSE = "Squirrel: I'll eat the Nut"
 
 
 class DogHandler(AbstractHandler):
-    def handle(self, request: Any) -> Optional[str]:
-        if request == "MeatBall":
-            return f"Dog: I'll eat the {request}"
-        else:
-            return super().handle(request)
+    __slots__ = ()
+
+    TRIGGER = "MeatBall"
+    RESPONSE = "Dog: I'll eat the MeatBall"
+
+
+class RouterHandler(AbstractHandler):
+    """
+    Answers on behalf of several handlers with a single table lookup. It is
+    still an AbstractHandler, so it can be chained like any other.
+    """
+
+    __slots__ = ('_table',)
+
+    def __init__(self, handlers: Iterable[AbstractHandler]) -> None:
+        super().__init__()
+        self._table: Dict[str, Callable[[Any], str]] = {}
+        for handler in handlers:
+            trigger = handler.TRIGGER
+            if trigger is not None:
+                self._table.setdefault(sys.intern(trigger), handler.respond)
+
+    def _try(self, request: Any) -> Optional[str]:
+        respond = self._table.get(request)
+        return respond(request) if respond is not None else None
 
 
 def client_code(handler: Handler) -> None:
@@ -216,3 +334,7 @@ if __name__ == "__main__":
 
     print("Subchain: Squirrel > Dog")
     client_code(squirrel)
+    print("\n")
+
+    print("Router: Monkey | Squirrel | Dog")
+    client_code(AbstractHandler.build([monkey, squirrel, dog]))
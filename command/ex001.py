@@ -122,17 +122,20 @@ Its objects can execute operations over various objects of different classes.
 
 
 from __future__ import annotations
-from abc import ABC, abstractmethod
+import sys
+import types
+from typing import Any, Callable, Dict, Optional, Tuple
 
 
-class Command(ABC):
+class Command:
     """
     The Command interface declares a method for executing a command.
     """
 
-    @abstractmethod
+    __slots__ = ()
+
     def execute(self) -> None:
-        pass
+        raise NotImplementedError
 
 
 class SimpleCommand(Command):
@@ -140,6 +143,8 @@ class SimpleCommand(Command):
     Some commands can implement simple operations on their own.
     """
 
+    __slots__ = ('_payload',)
+
     def __init__(self, payload: str) -> None:
         self._payload = payload
 
@@ -154,6 +159,8 @@ class ComplexCommand(Command):
     objects, called "receivers."
     """
 
+    __slots__ = ('_receiver', '_a', '_b')
+
     def __init__(self, receiver: Receiver, a: str, b: str) -> None:
         """
         Complex commands can accept one or several receiver objects along with
@@ -169,12 +176,12 @@ class ComplexCommand(Command):
         Commands can delegate to any methods of a receiver.
         """
 
-        print(
+        sys.stdout.write(
             "ComplexCommand: Complex stuff should "
-            "be done by a receiver object", end=""
+            "be done by a receiver object"
+            f"{self._receiver.do_something(self._a)}"
+            f"{self._receiver.do_something_else(self._b)}"
         )
-        self._receiver.do_something(self._a)
-        self._receiver.do_something_else(self._b)
 
 
 class Receiver:
@@ -185,11 +192,13 @@ class Receiver:
     any class may serve as a Receiver.
     """
 
-    def do_something(self, a: str) -> None:
-        print(f"\nReceiver: Working on ({a}.)", end="")
+    __slots__ = ()
 
-    def do_something_else(self, b: str) -> None:
-        print(f"\nReceiver: Also working on ({b}.)", end="")
+    def do_something(self, a: str) -> str:
+        return f"\nReceiver: Working on ({a}.)"
+
+    def do_something_else(self, b: str) -> str:
+        return f"\nReceiver: Also working on ({b}.)"
 
 
 class Invoker:
@@ -198,8 +207,22 @@ class Invoker:
     to the command.
     """
 
-    _on_start = None
-    _on_finish = None
+    __slots__ = (
+        '_on_start',
+        '_on_finish',
+        '_on_start_exec',
+        '_on_finish_exec',
+        '_run',
+    )
+
+    # Generated bodies of `do_something_important`, one per combination of
+    # commands being set, shared by every Invoker.
+    _specialized: Dict[Tuple[bool, bool], Callable[[Invoker], None]] = {}
+
+    def __init__(self) -> None:
+        self._on_start: Optional[Command] = None
+        self._on_finish: Optional[Command] = None
+        self._respecialize()
 
     """
     Initialize commands.
@@ -207,9 +230,14 @@ class Invoker:
 
     def set_on_start(self, command: Command):
         self._on_start = command
+        # Bind `execute` once so running the command needs no lookup.
+        self._on_start_exec = command.execute
+        self._respecialize()
 
     def set_on_finish(self, command: Command):
         self._on_finish = command
+        self._on_finish_exec = command.execute
+        self._respecialize()
 
     def do_something_important(self) -> None:
         """
@@ -218,15 +246,46 @@ class Invoker:
         by executing a command.
         """
 
-        print("Invoker: Does anybody want something done before I begin?")
-        if isinstance(self._on_start, Command):
-            self._on_start.execute()
+        self._run()
 
-        print("Invoker: ...doing something really important...")
+    def _respecialize(self) -> None:
+        """
+        Bind the body of do_something_important generated for the commands
+        currently set.
+        """
 
-        print("Invoker: Does anybody want something done after I finish?")
-        if isinstance(self._on_finish, Command):
-            self._on_finish.execute()
+        run = self._specialize(
+            self._on_start is not None, self._on_finish is not None
+        )
+        self._run = types.MethodType(run, self)
+
+    @classmethod
+    def _specialize(
+        cls, has_start: bool, has_finish: bool
+    ) -> Callable[[Invoker], None]:
+        key = (has_start, has_finish)
+        run = cls._specialized.get(key)
+        if run is None:
+            lines = [
+                "def _run(self):",
+                "    print('Invoker: Does anybody want something done "
+                "before I begin?')",
+            ]
+            if has_start:
+                lines.append("    self._on_start_exec()")
+            lines += [
+                "    print('Invoker: ...doing something really important...')",
+                "    print('Invoker: Does anybody want something done "
+                "after I finish?')",
+            ]
+            if has_finish:
+                lines.append("    self._on_finish_exec()")
+
+            namespace: Dict[str, Any] = {}
+            exec(compile("\n".join(lines), "<invoker>", "exec"), namespace)
+            run = cls._specialized[key] = namespace["_run"]
+
+        return run
 
 
 if __name__ == "__main__":
@@ -1,9 +1,11 @@
-from abc import ABC, abstractmethod
+from collections import deque
 
 
 # A classe base de comando define a interface comum para todos os comandos
 # concretos.
-class Command(ABC):
+class Command:
+    __slots__ = ('app', 'editor', 'backup')
+
     def __init__(self, app, editor):
         self.app = app
         self.editor = editor
@@ -17,17 +19,18 @@ class Command(ABC):
     def undo(self):
         self.editor.text = self.backup
 
-    # O método de execução é declarado abstrato para forçar todos
-    # os comandos concretos a fornecerem suas próprias implementações.
+    # O método de execução não tem implementação na base. Um comando
+    # concreto que não o fornecer só falha quando execute() for chamado.
     # O método deve retornar True ou False dependendo se o comando
     # altera o estado do editor.
-    @abstractmethod
     def execute(self):
-        pass
+        raise NotImplementedError
 
 
 # Os comandos concretos vão aqui.
 class CopyCommand(Command):
+    __slots__ = ()
+
     # O comando de cópia não é salvo no histórico, pois ele não
     # altera o estado do editor.
     def execute(self):
@@ -36,6 +39,8 @@ class CopyCommand(Command):
 
 
 class CutCommand(Command):
+    __slots__ = ()
+
     # O comando de corte altera o estado do editor, portanto,
     # ele deve ser salvo no histórico. E será salvo desde que
     # o método retorne True.
@@ -47,6 +52,8 @@ class CutCommand(Command):
 
 
 class PasteCommand(Command):
+    __slots__ = ()
+
     def execute(self):
         self.save_backup()
         self.editor.replace_selection(self.app.clipboard)
@@ -55,15 +62,20 @@ class PasteCommand(Command):
 
 # A operação de desfazer também é um comando.
 class UndoCommand(Command):
+    __slots__ = ()
+
     def execute(self):
         self.app.undo()
         return False
 
 
-# O histórico de comandos global é apenas uma pilha.
+# O histórico de comandos global é apenas uma pilha, limitada para não
+# crescer indefinidamente: os comandos mais antigos são descartados.
 class CommandHistory:
+    MAX_SIZE = 10_000
+
     def __init__(self):
-        self.history = []
+        self.history = deque(maxlen=self.MAX_SIZE)
 
     # Último a entrar...
     def push(self, command):
@@ -75,6 +87,11 @@ class CommandHistory:
             return self.history.pop()
         return None
 
+    # Empilhar vários comandos de uma vez, por exemplo ao carregar um
+    # histórico salvo.
+    def extend(self, commands):
+        self.history.extend(commands)
+
 
 # A classe editor tem operações reais de edição de texto.
 # Ela desempenha o papel de receptor: todos os comandos acabam delegando
@@ -105,12 +122,13 @@ class Application:
         self.editors = [Editor()]
         self.active_editor = self.editors[0]
         self.history = CommandHistory()
+        self._cmd_cache = {}
 
     # O código que atribui comandos aos objetos de UI pode ser parecido com
     # este.
     def create_ui(self):
         copy = lambda: self.execute_command(  # noqa
-            CopyCommand(self, self.active_editor)
+            self._make(CopyCommand)
         )
 
         cut = lambda: self.execute_command(  # noqa
@@ -122,7 +140,7 @@ class Application:
         )
 
         undo = lambda: self.execute_command(  # noqa
-            UndoCommand(self, self.active_editor)
+            self._make(UndoCommand)
         )
 
         # Simular atribuição de comandos a botões e atalhos.
@@ -146,11 +164,30 @@ class Application:
         paste_button()
         undo_button()
 
+    # Reaproveitar o comando já criado para o par (classe, editor) em vez de
+    # instanciar um novo a cada acionamento. Só vale para comandos que não
+    # alteram o editor (cópia, desfazer): os demais vão para o histórico com
+    # o seu próprio backup e precisam ser criados a cada vez.
+    def _make(self, cls):
+        key = (cls, id(self.active_editor))
+        command = self._cmd_cache.get(key)
+        if command is None:
+            command = self._cmd_cache[key] = cls(self, self.active_editor)
+        return command
+
     # Executar um comando e verificar se ele deve ser adicionado ao histórico.
     def execute_command(self, command):
         if command.execute():
             self.history.push(command)
 
+    # Executar uma sequência de comandos, como ao reproduzir um log de
+    # operações, com o mesmo critério de histórico de execute_command.
+    def execute_many(self, commands):
+        push = self.history.push
+        for command in commands:
+            if command.execute():
+                push(command)
+
     # Pegar o comando mais recente do histórico e executar seu método de
     # desfazer.
     # Note que não sabemos a classe desse comando. Mas não precisamos,
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+import os
 import pathlib
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 """
 Applicability
@@ -93,6 +96,8 @@ complex structures instead of re-constructing them from scratch.
 
 
 class FileSystemComponent(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def show_details(self):
         pass
@@ -103,20 +108,31 @@ class FileSystemComponent(ABC):
 
 
 class File(FileSystemComponent):
+    __slots__ = ('name', 'content_bytes')
+
     def __init__(self, name: str, content: str):
         self.name = name
-        self.content = content
+        # Kept encoded, since that is the form every create() writes out.
+        self.content_bytes = content.encode('utf-8')
+
+    @property
+    def content(self) -> str:
+        return self.content_bytes.decode('utf-8')
+
+    @content.setter
+    def content(self, content: str) -> None:
+        self.content_bytes = content.encode('utf-8')
 
     def show_details(self):
         print(f"File: {self.name}")
 
     def create(self, base_path: pathlib.Path):
-        file_path = base_path / self.name
-        file_path.touch()
-        file_path.write_text(self.content)
+        _write_file(os.path.join(base_path, self.name), self.content_bytes)
 
 
 class Directory(FileSystemComponent):
+    __slots__ = ('name', 'components')
+
     def __init__(
         self,
         name,
@@ -134,28 +150,147 @@ class Directory(FileSystemComponent):
     def remove(self, component):
         self.components.remove(component)
 
+    # Both traversals below keep an explicit stack instead of recursing into
+    # subdirectories; other components still handle themselves.
+
     def show_details(self):
-        print(f"Directory: {self.name}")
-        for component in self.components:
-            component.show_details()
+        stack: List[FileSystemComponent] = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Directory):
+                print(f"Directory: {node.name}")
+                stack.extend(reversed(node.components))
+            else:
+                node.show_details()
 
     def create(self, base_path: pathlib.Path):
-        dir_path = base_path / self.name
-        if not dir_path.exists():
-            dir_path.mkdir()
-        for component in self.components:
-            component.create(dir_path)
+        # Paths are handled as plain strings: os.path is much cheaper than
+        # building a Path object per node.
+        stack: List[Tuple[FileSystemComponent, str]] = [
+            (self, str(base_path))
+        ]
+        while stack:
+            node, parent_path = stack.pop()
+            if isinstance(node, Directory):
+                dir_path = os.path.join(parent_path, node.name)
+                os.makedirs(dir_path, exist_ok=True)
+                stack.extend((child, dir_path) for child in node.components)
+            else:
+                node.create(parent_path)
+
+    def flatten(
+        self
+    ) -> Tuple[List[str], List[Optional[bytes]], List[int]]:
+        """
+        Walk the tree once, breadth-first, into three parallel lists: the
+        node names, the encoded file contents (None for directories) and,
+        for each node, the index of its parent in the output of create_flat,
+        where index 0 is the base path and node i sits at index i + 1.
+        Parents always come before their children.
+        """
+
+        names: List[str] = []
+        contents: List[Optional[bytes]] = []
+        parent_idx: List[int] = []
+
+        queue = deque([(self, 0)])
+        while queue:
+            node, parent = queue.popleft()
+            names.append(node.name)
+            parent_idx.append(parent)
+            if isinstance(node, Directory):
+                contents.append(None)
+                index = len(names)
+                queue.extend((child, index) for child in node.components)
+            else:
+                contents.append(node.content_bytes)
+
+        return names, contents, parent_idx
+
+    def flatten_and_create(
+        self,
+        base_path: pathlib.Path,
+        executor: Optional[Executor] = None
+    ) -> None:
+        """
+        Create the whole tree in two phases: one os.makedirs call per leaf
+        directory, which creates every ancestor on the way, then the files.
+
+        Once the directories exist the files are independent of each other,
+        so an executor, if given, writes them concurrently. That assumes no
+        two files in the same directory share a name.
+        """
+
+        names, contents, parent_idx = self.flatten()
+        paths = [str(base_path)]
+        has_subdir = set()
+        directories = []
+        files = []
+        for name, content, parent in zip(names, contents, parent_idx):
+            path = os.path.join(paths[parent], name)
+            paths.append(path)
+            if content is None:
+                directories.append(len(paths) - 1)
+                has_subdir.add(parent)
+            else:
+                files.append((path, content))
+
+        for index in directories:
+            if index not in has_subdir:
+                os.makedirs(paths[index], exist_ok=True)
+
+        if executor is None or not files:
+            for path, content in files:
+                _write_file(path, content)
+        else:
+            # Consume the results so any write error is raised here.
+            for _ in executor.map(_write_file, *zip(*files)):
+                pass
+
+
+def _write_file(path: str, content: bytes) -> None:
+    with open(path, 'wb') as f:
+        f.write(content)
+
+
+def create_flat(
+    names: List[str],
+    contents: List[Optional[bytes]],
+    parent_idx: List[int],
+    base: pathlib.Path
+) -> None:
+    """
+    Materialize a tree produced by Directory.flatten in a single loop.
+    """
+
+    paths = [str(base)]
+    for name, content, parent in zip(names, contents, parent_idx):
+        path = os.path.join(paths[parent], name)
+        paths.append(path)
+        if content is None:
+            os.makedirs(path, exist_ok=True)
+        else:
+            _write_file(path, content)
 
 
 def create_file_structure(
     component: FileSystemComponent,
-    base_path_str: str
+    base_path_str: str,
+    executor: Optional[Executor] = None
 ):
+    """
+    File creation is I/O-bound, so a ThreadPoolExecutor (something like
+    min(32, os.cpu_count() * 4) workers) can be passed in to write files
+    concurrently.
+    """
+
     base_path = pathlib.Path(base_path_str)
-    if not base_path.exists():
-        base_path.mkdir(parents=True)
+    base_path.mkdir(parents=True, exist_ok=True)
 
-    component.create(base_path)
+    if isinstance(component, Directory):
+        component.flatten_and_create(base_path, executor)
+    else:
+        component.create(base_path)
 
 
 if __name__ == "__main__":
@@ -175,4 +310,5 @@ if __name__ == "__main__":
 
     root_dir.show_details()
 
-    create_file_structure(root_dir, ".")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        create_file_structure(root_dir, ".", executor)
@@ -1,3 +1,5 @@
+import functools
+import math
 import time
 
 
@@ -108,18 +110,21 @@ own, whereas the composition of Decorators is always controlled by the client.
 """
 
 
+now_ns = time.perf_counter_ns
+
+
 class Instant:
     def __init__(self) -> None:
-        self.start = time.perf_counter()
+        self.start = now_ns()
 
     def elapsed_s(self):
-        return (time.perf_counter() - self.start)
+        return (now_ns() - self.start) / 1_000_000_000
 
     def elapsed_micr_s(self):
-        return (time.perf_counter() - self.start) * 1_000_000
+        return (now_ns() - self.start) / 1_000
 
     def elapsed_ms(self):
-        return (time.perf_counter() - self.start) * 1_000
+        return (now_ns() - self.start) / 1_000_000
 
     @staticmethod
     def now() -> 'Instant':
@@ -127,18 +132,17 @@ class Instant:
 
 
 def d(f):
-    def inner():
-        start = Instant.now()
-        f()
-        print(f"Time: {start.elapsed_ms()} ms")
+    @functools.wraps(f)
+    def inner(*args, **kwargs):
+        start = now_ns()
+        result = f(*args, **kwargs)
+        print(f"Time: {(now_ns() - start) / 1_000_000} ms")
+        return result
     return inner
 
 
 def do_something():
-    i = 1
-    for j in range(1, 21):
-        i *= j
-    print(f"Result: {i}")
+    print(f"Result: {math.factorial(20)}")
 
 
 def main():
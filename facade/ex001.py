@@ -1,4 +1,6 @@
 from __future__ import annotations
+import sys
+from typing import Optional
 
 
 """
@@ -91,31 +93,55 @@ class Facade:
     the undesired complexity of the subsystem.
     """
 
-    def __init__(self, subsystem1: Subsystem1, subsystem2: Subsystem2) -> None:
+    __slots__ = ('_subsystem1', '_subsystem2', '_cached')
+
+    def __init__(
+        self,
+        subsystem1: Optional[Subsystem1] = None,
+        subsystem2: Optional[Subsystem2] = None,
+    ) -> None:
         """
         Depending on your application's needs, you can provide the Facade with
         existing subsystem objects or force the Facade to create them on its
         own.
         """
 
-        self._subsystem1 = subsystem1 or Subsystem1()
-        self._subsystem2 = subsystem2 or Subsystem2()
+        self._subsystem1 = Subsystem1() if subsystem1 is None else subsystem1
+        self._subsystem2 = Subsystem2() if subsystem2 is None else subsystem2
+        self._cached: Optional[str] = None
 
     def operation(self) -> str:
         """
         The Facade's methods are convenient shortcuts to the sophisticated
         functionality of the subsystems. However, clients get only
         to a fraction of a subsystem's capabilities.
+
+        The subsystems here are stateless, so the report is built once and
+        reused on later calls.
         """
 
-        results = []
-        results.append("Facade initializes subsystems:")
-        results.append(self._subsystem1.operation1())
-        results.append(self._subsystem2.operation1())
-        results.append("Facade orders subsystems to perform the action:")
-        results.append(self._subsystem1.operation_n())
-        results.append(self._subsystem2.operation_z())
-        return "\n".join(results)
+        result = self._cached
+        if result is None:
+            result = self._cached = self._build()
+        return result
+
+    def _build(self) -> str:
+        subsystem1 = self._subsystem1
+        subsystem2 = self._subsystem2
+        return (
+            "Facade initializes subsystems:\n"
+            f"{subsystem1.operation1()}\n"
+            f"{subsystem2.operation1()}\n"
+            "Facade orders subsystems to perform the action:\n"
+            f"{subsystem1.operation_n()}\n"
+            f"{subsystem2.operation_z()}"
+        )
+
+
+_S1_OP1 = sys.intern("Subsystem1: Ready!")
+_S1_OPN = sys.intern("Subsystem1: Go!")
+_S2_OP1 = sys.intern("Subsystem2: Get ready!")
+_S2_OPZ = sys.intern("Subsystem2: Fire!")
 
 
 class Subsystem1:
@@ -125,13 +151,15 @@ class Subsystem1:
     yet another client, and it's not a part of the Subsystem.
     """
 
+    __slots__ = ()
+
     def operation1(self) -> str:
-        return "Subsystem1: Ready!"
+        return _S1_OP1
 
     # ...
 
     def operation_n(self) -> str:
-        return "Subsystem1: Go!"
+        return _S1_OPN
 
 
 class Subsystem2:
@@ -139,13 +167,15 @@ class Subsystem2:
     Some facades can work with multiple subsystems at the same time.
     """
 
+    __slots__ = ()
+
     def operation1(self) -> str:
-        return "Subsystem2: Get ready!"
+        return _S2_OP1
 
     # ...
 
     def operation_z(self) -> str:
-        return "Subsystem2: Fire!"
+        return _S2_OPZ
 
 
 def client_code(facade: Facade) -> None:
@@ -1,13 +1,12 @@
-from abc import ABC, abstractmethod
+class DocumentFactory:
+    __slots__ = ()
 
-
-class DocumentFactory(ABC):
-    @abstractmethod
     def create_page(self) -> 'Page':
         raise NotImplementedError
 
 
-class Page(ABC):
-    @abstractmethod
+class Page:
+    __slots__ = ()
+
     def describe(self):
-        pass
+        raise NotImplementedError
@@ -2,10 +2,17 @@ from interface import DocumentFactory, Page
 
 
 class ReportFactory(DocumentFactory):
+    __slots__ = ()
+
     def create_page(self):
-        return ReportPage()
+        return _REPORT_PAGE
 
 
 class ReportPage(Page):
+    __slots__ = ()
+
     def describe(self):
         return "This is a report page."
+
+
+_REPORT_PAGE = ReportPage()
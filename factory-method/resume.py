@@ -2,10 +2,17 @@ from interface import DocumentFactory, Page
 
 
 class ResumeFactory(DocumentFactory):
+    __slots__ = ()
+
     def create_page(self):
-        return ResumePage()
+        return _RESUME_PAGE
 
 
 class ResumePage(Page):
+    __slots__ = ()
+
     def describe(self):
         return "This is a resume page."
+
+
+_RESUME_PAGE = ResumePage()
@@ -1,4 +1,3 @@
-from abc import ABC, abstractmethod
 from enum import Enum
 
 
@@ -9,15 +8,18 @@ class VehicleType(Enum):
     BICYCLE = "Bicycle"
 
 
-# Step 1: Create an abstract Vehicle class
-class Vehicle(ABC):
-    @abstractmethod
+# Step 1: Create a base Vehicle class
+class Vehicle:
+    __slots__ = ()
+
     def get_name(self) -> str:
-        pass
+        raise NotImplementedError
+
 
+# Step 2: Create concrete vehicle classes sharing one named implementation
+class _NamedVehicle(Vehicle):
+    __slots__ = ('_name',)
 
-# Step 2: Create concrete vehicle classes
-class Car(Vehicle):
     def __init__(self, name):
         self._name = name
 
@@ -26,38 +28,37 @@ class Car(Vehicle):
         return self._name
 
 
-class Motorcycle(Vehicle):
-    def __init__(self, name):
-        self._name = name
+class Car(_NamedVehicle):
+    __slots__ = ()
 
-    # Implement the get_name() method
-    def get_name(self):
-        return self._name
 
+class Motorcycle(_NamedVehicle):
+    __slots__ = ()
 
-class Bicycle(Vehicle):
-    def __init__(self, name):
-        self._name = name
 
-    # Implement the get_name() method
-    def get_name(self):
-        return self._name
+class Bicycle(_NamedVehicle):
+    __slots__ = ()
+
+
+# Step 3: Map each vehicle type to its class
+_VEHICLE_CTORS = {
+    VehicleType.CAR: Car,
+    VehicleType.MOTORCYCLE: Motorcycle,
+    VehicleType.BICYCLE: Bicycle,
+}
 
 
-# Step 3: Create a VehicleFactory class
+# Step 4: Create a VehicleFactory class
 class VehicleFactory:
     def create_vehicle(self, vehicle_type: VehicleType) -> Vehicle:
-        if vehicle_type == VehicleType.CAR:
-            return Car(VehicleType.CAR.value)
-        elif vehicle_type == VehicleType.MOTORCYCLE:
-            return Motorcycle(VehicleType.MOTORCYCLE.value)
-        elif vehicle_type == VehicleType.BICYCLE:
-            return Bicycle(VehicleType.BICYCLE.value)
-        else:
+        try:
+            cls = _VEHICLE_CTORS[vehicle_type]
+        except KeyError:
             raise NotImplementedError
+        return cls(vehicle_type.value)
 
 
-# Step 4: Test the VehicleFactory class
+# Step 5: Test the VehicleFactory class
 def main():
     vehicle_factory = VehicleFactory()
 
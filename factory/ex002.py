@@ -1,4 +1,3 @@
-from abc import ABC, abstractmethod
 from enum import Enum
 
 
@@ -8,13 +7,16 @@ class VehicleType(Enum):
     BICYCLE = "Bicycle"
 
 
-class Vehicle(ABC):
-    @abstractmethod
+class Vehicle:
+    __slots__ = ()
+
     def get_name(self) -> str:
-        pass
+        raise NotImplementedError
+
 
+class _NamedVehicle(Vehicle):
+    __slots__ = ('_name',)
 
-class Car(Vehicle):
     def __init__(self, name):
         self._name = name
 
@@ -22,32 +24,30 @@ class Car(Vehicle):
         return self._name
 
 
-class Motorcycle(Vehicle):
-    def __init__(self, name):
-        self._name = name
+class Car(_NamedVehicle):
+    __slots__ = ()
 
-    def get_name(self):
-        return self._name
 
+class Motorcycle(_NamedVehicle):
+    __slots__ = ()
 
-class Bicycle(Vehicle):
-    def __init__(self, name):
-        self._name = name
 
-    def get_name(self):
-        return self._name
+class Bicycle(_NamedVehicle):
+    __slots__ = ()
 
 
-def create_vehicle(v_type: VehicleType, name: str):
-    match v_type:
-        case VehicleType.CAR:
-            return Car(name)
+_VEHICLE_CTORS = {
+    VehicleType.CAR: Car,
+    VehicleType.MOTORCYCLE: Motorcycle,
+    VehicleType.BICYCLE: Bicycle,
+}
 
-        case VehicleType.MOTORCYCLE:
-            return Motorcycle(name)
 
-        case VehicleType.BICYCLE:
-            return Bicycle(name)
+def create_vehicle(v_type: VehicleType, name: str):
+    cls = _VEHICLE_CTORS.get(v_type)
+    if cls is None:
+        return None
+    return cls(name)
 
 
 bike = create_vehicle(VehicleType.BICYCLE, 'bike')
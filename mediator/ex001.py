@@ -137,15 +137,26 @@ class ConcreteMediator(Mediator):
         self._component1.mediator = self
         self._component2 = component2
         self._component2.mediator = self
+        # Handlers are resolved to bound methods once, here, so notify() is a
+        # single lookup through the table's bound get() followed by a call.
+        self._dispatch = {
+            "A": self._on_a,
+            "D": self._on_d,
+        }.get
 
     def notify(self, sender: object, event: str) -> None:
-        if event == "A":
-            print("Mediator reacts on A and triggers following operations:")
-            self._component2.send_request("C")
-        elif event == "D":
-            print("Mediator reacts on D and triggers following operations:")
-            self._component1.send_request("B")
-            self._component2.send_request("C")
+        handler = self._dispatch(event)
+        if handler is not None:
+            handler()
+
+    def _on_a(self) -> None:
+        print("Mediator reacts on A and triggers following operations:")
+        self._component2.send_request("C")
+
+    def _on_d(self) -> None:
+        print("Mediator reacts on D and triggers following operations:")
+        self._component1.send_request("B")
+        self._component2.send_request("C")
 
 
 class BaseComponent:
@@ -154,16 +165,10 @@ class BaseComponent:
     instance inside component objects.
     """
 
-    def __init__(self, mediator: Optional[Mediator] = None) -> None:
-        self._mediator = mediator
-
-    @property
-    def mediator(self) -> Optional[Mediator]:
-        return self._mediator
+    __slots__ = ('mediator',)
 
-    @mediator.setter
-    def mediator(self, mediator: Mediator) -> None:
-        self._mediator = mediator
+    def __init__(self, mediator: Optional[Mediator] = None) -> None:
+        self.mediator: Optional[Mediator] = mediator
 
 
 """
@@ -173,21 +178,27 @@ components. They also don't depend on any concrete mediator classes.
 
 
 class Component1(BaseComponent):
+    __slots__ = ()
+
     def send_request(self, request) -> None:
         print(f"Component 1 does {request}.")
-        if self.mediator is None:
+        mediator = self.mediator
+        if mediator is None:
             raise TypeError
 
-        self.mediator.notify(self, request)
+        mediator.notify(self, request)
 
 
 class Component2(BaseComponent):
+    __slots__ = ()
+
     def send_request(self, request) -> None:
         print(f"Component 2 does {request}.")
-        if self.mediator is None:
+        mediator = self.mediator
+        if mediator is None:
             raise TypeError
 
-        self.mediator.notify(self, request)
+        mediator.notify(self, request)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,13 @@
 from __future__ import annotations
-from abc import ABC, abstractmethod
-from datetime import datetime
-from random import sample
+import logging
+import sys
+from collections import deque
+from random import randbytes
 from string import ascii_letters
-from typing import List
+from time import localtime, strftime, time
+from typing import Deque, List
+
+log = logging.getLogger(__name__)
 
 """
  Applicability
@@ -96,6 +100,43 @@ links are easy to re-establish.
 
 """
 
+# Oldest snapshots are dropped once a history grows past this size.
+MAX_UNDO = 128
+
+# Snapshot states shorter than this are interned.
+_INTERN_LIMIT = 4096
+
+# Random strings are drawn from raw random bytes instead of one choice per
+# character. Bytes 0..207 map evenly onto the 52 letters and the remaining
+# values are discarded, so the result stays uniform.
+_LETTER_TABLE = bytes.maketrans(
+    bytes(range(4 * len(ascii_letters))), (ascii_letters * 4).encode()
+)
+_DISCARD = bytes(range(4 * len(ascii_letters), 256))
+
+
+def _push(history: Deque[Memento], memento: Memento) -> None:
+    """
+    Appends to a bounded history, handing the snapshot it evicts back to its
+    pool when nothing else still refers to it.
+    """
+    if len(history) == history.maxlen:
+        evicted = history.popleft()
+        # Only a snapshot nobody else holds is recycled; one the caller kept
+        # must not change under them. The two references counted here are
+        # the local name and getrefcount's own argument.
+        if sys.getrefcount(evicted) <= 2:
+            evicted.release()
+    history.append(memento)
+
+
+def _random_letters(length: int) -> str:
+    out = b""
+    while len(out) < length:
+        chunk = randbytes(2 * (length - len(out)))
+        out += chunk.translate(_LETTER_TABLE, _DISCARD)
+    return out[:length].decode("ascii")
+
 
 class Originator:
     """
@@ -104,16 +145,14 @@ class Originator:
     memento and another method for restoring the state from it.
     """
 
-    _state = None
-    """
-    For the sake of simplicity, the originator's state is
-    stored inside a single variable.
-    """
+    # For the sake of simplicity, the originator's state is
+    # stored inside a single variable.
+    __slots__ = ('_state', 'restored')
 
     def __init__(self, state: str) -> None:
         self._state = state
-        print(f"Originator: My initial state is: {self._state}")
-        self.restored: List[Memento] = []
+        log.debug("Originator: My initial state is: %s", self._state)
+        self.restored: Deque[Memento] = deque(maxlen=MAX_UNDO)
 
     def do_something(self) -> None:
         """
@@ -122,13 +161,13 @@ class Originator:
         of the business logic via the save() method.
         """
 
-        print("Originator: I'm doing something important.")
+        log.debug("Originator: I'm doing something important.")
         self._state = self._generate_random_string(5)
-        print(f"Originator: and my state has changed to: {self._state}")
+        log.debug("Originator: and my state has changed to: %s", self._state)
 
     @staticmethod
     def _generate_random_string(length: int = 10) -> str:
-        return "".join(sample(ascii_letters, length))
+        return _random_letters(length)
 
     def save(self) -> Memento:
         """
@@ -137,15 +176,15 @@ class Originator:
         if self._state is None:
             raise AttributeError
 
-        return Snapshot(self._state)
+        return Snapshot.acquire(self._state)
 
     def restore(self, memento: Memento) -> None:
         """
         Restores the Originator's state from a memento object.
         """
         self._state = memento.state
-        print(f"Originator: My state has changed to: {self._state}")
-        self.restored.append(memento)
+        log.debug("Originator: My state has changed to: %s", self._state)
+        _push(self.restored, memento)
 
     def unrestore(self, memento: Memento) -> None:
         """
@@ -154,32 +193,72 @@ class Originator:
         ...
 
 
-class Memento(ABC):
+class Memento:
     """
     The Memento interface provides a way to retrieve the memento's metadata,
     such as creation date or name. However, it doesn't expose the Originator's
     state.
     """
+    __slots__ = ()
+
     state: str
     date: str
 
     @property
-    @abstractmethod
-    def name(str):
+    def name(self) -> str:
         raise NotImplementedError('name')
 
+    def release(self) -> None:
+        """
+        Called once the memento has left every history and nothing else holds
+        it, so it can be reused.
+        """
+
 
 class Snapshot(Memento):
+    __slots__ = ('state', 'date', '_name')
+
+    # Evicted snapshots are recycled here instead of being reallocated.
+    _pool: List[Snapshot] = []
+
+    # Backups taken within the same wall-clock second share one date string.
+    _last_sec = -1
+    _last_date = ""
+
     def __init__(self, state: str) -> None:
-        self.state = state
-        self.date = str(datetime.now())[:19]
+        self._reset(state)
+
+    @classmethod
+    def acquire(cls, state: str) -> Snapshot:
+        pool = cls._pool
+        if pool:
+            snapshot = pool.pop()
+            snapshot._reset(state)
+            return snapshot
+        return cls(state)
+
+    def release(self) -> None:
+        pool = self._pool
+        if len(pool) < MAX_UNDO:
+            pool.append(self)
+
+    def _reset(self, state: str) -> None:
+        # Repeated states share one string object; very long ones are kept
+        # as-is rather than growing the intern table.
+        self.state = sys.intern(state) if len(state) < _INTERN_LIMIT else state
+        sec = int(time())
+        if sec != Snapshot._last_sec:
+            Snapshot._last_sec = sec
+            Snapshot._last_date = strftime("%Y-%m-%d %H:%M:%S", localtime(sec))
+        self.date = Snapshot._last_date
+        self._name = f"{self.date} / ({state[0:9]}...)"
 
     @property
     def name(self) -> str:
         """
         The rest of the methods are used by the Caretaker to display metadata.
         """
-        return f"{self.date} / ({self.state[0:9]}...)"
+        return self._name
 
     def __repr__(self) -> str:
         return f"""
@@ -194,35 +273,37 @@ class Caretaker:
     It works with all mementos via the base Memento interface.
     """
 
+    __slots__ = ('_history', '_originator')
+
     def __init__(self, originator: Originator) -> None:
-        self._history: List[Memento] = []
+        self._history: Deque[Memento] = deque(maxlen=MAX_UNDO)
         self._originator = originator
 
     def backup(self) -> None:
-        print("\nCaretaker: Saving Originator's state...")
+        log.debug("\nCaretaker: Saving Originator's state...")
         m = self._originator.save()
-        self._history.append(m)
+        _push(self._history, m)
 
     def undo(self) -> None:
-        if not len(self._history):
+        if not self._history:
+            log.warning('Cannot undo')
             return
 
-        try:
-            memento = self._history.pop()
-            print(f"Caretaker: Restoring state to: {memento.name}")
+        memento = self._history.pop()
+        log.debug("Caretaker: Restoring state to: %s", memento.name)
 
-            self._originator.restore(memento)
-        except Exception:
-            print('Cannot undo')
+        self._originator.restore(memento)
 
     def redo(self) -> None:
-        try:
-            memento = self._originator.restored.pop()
-            print(f"Caretaker: Unrestoring state to: {memento.name}")
-            self._history.append(memento)
-            print(f"Caretaker: Received memento: {memento}")
-        except Exception:
-            print('Cannot redo')
+        restored = self._originator.restored
+        if not restored:
+            log.warning('Cannot redo')
+            return
+
+        memento = restored.pop()
+        log.debug("Caretaker: Unrestoring state to: %s", memento.name)
+        _push(self._history, memento)
+        log.debug("Caretaker: Received memento: %s", memento)
 
     def show_history(self) -> None:
         print("Caretaker: Here's the list of mementos:")
@@ -231,6 +312,10 @@ class Caretaker:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG, format="%(message)s", stream=sys.stdout
+    )
+
     originator = Originator("Super-duper-super-puper-super.")
     caretaker = Caretaker(originator)
 
@@ -1,8 +1,52 @@
 from __future__ import annotations
-from datetime import datetime
-from random import sample
+import logging
+import sys
+from collections import deque
+from random import randbytes
 from string import ascii_letters
-from typing import List
+from time import localtime, strftime, time
+from typing import Deque, List, Optional
+
+log = logging.getLogger(__name__)
+
+# Oldest snapshots are dropped once a history grows past this size.
+MAX_UNDO = 128
+
+# Snapshot states shorter than this are interned.
+_INTERN_LIMIT = 4096
+
+# Random strings are drawn from raw random bytes instead of one choice per
+# character. Bytes 0..207 map evenly onto the 52 letters and the remaining
+# values are discarded, so the result stays uniform.
+_LETTER_TABLE = bytes.maketrans(
+    bytes(range(4 * len(ascii_letters))), (ascii_letters * 4).encode()
+)
+_DISCARD = bytes(range(4 * len(ascii_letters), 256))
+
+
+def _push(
+    history: Deque[Originator.Snapshot], snapshot: Originator.Snapshot
+) -> None:
+    """
+    Appends to a bounded history, handing the snapshot it evicts back to the
+    pool when nothing else still refers to it.
+    """
+    if len(history) == history.maxlen:
+        evicted = history.popleft()
+        # Only a snapshot nobody else holds is recycled; one the caller kept
+        # must not change under them. The two references counted here are
+        # the local name and getrefcount's own argument.
+        if sys.getrefcount(evicted) <= 2:
+            evicted.release()
+    history.append(snapshot)
+
+
+def _random_letters(length: int) -> str:
+    out = b""
+    while len(out) < length:
+        chunk = randbytes(2 * (length - len(out)))
+        out += chunk.translate(_LETTER_TABLE, _DISCARD)
+    return out[:length].decode("ascii")
 
 
 class Originator:
@@ -12,16 +56,50 @@ class Originator:
     memento and another method for restoring the state from it.
     """
 
-    _state = None
-    """
-    For the sake of simplicity, the originator's state is
-    stored inside a single variable.
-    """
+    # For the sake of simplicity, the originator's state is
+    # stored inside a single variable.
+    __slots__ = ('_state', 'restored')
 
     class Snapshot:
+        __slots__ = ('state', 'date', '_name')
+
+        # Evicted snapshots are recycled here instead of being reallocated.
+        _pool: List[Originator.Snapshot] = []
+
+        # Backups taken within the same wall-clock second share one date.
+        _last_sec = -1
+        _last_date = ""
+
         def __init__(self, state: str) -> None:
+            self._reset(state)
+
+        @classmethod
+        def acquire(cls, state: str) -> Originator.Snapshot:
+            pool = cls._pool
+            if pool:
+                snapshot = pool.pop()
+                snapshot._reset(state)
+                return snapshot
+            return cls(state)
+
+        def release(self) -> None:
+            pool = self._pool
+            if len(pool) < MAX_UNDO:
+                pool.append(self)
+
+        def _reset(self, state: str) -> None:
+            # Repeated states share one string object; very long ones are kept
+            # as-is rather than growing the intern table.
+            if len(state) < _INTERN_LIMIT:
+                state = sys.intern(state)
             self.state = state
-            self.date = str(datetime.now())[:19]
+            sec = int(time())
+            cls = type(self)
+            if sec != cls._last_sec:
+                cls._last_sec = sec
+                cls._last_date = strftime("%Y-%m-%d %H:%M:%S", localtime(sec))
+            self.date = cls._last_date
+            self._name: Optional[str] = None
 
         @property
         def name(self) -> str:
@@ -29,7 +107,10 @@ class Originator:
             The rest of the methods are used by the Caretaker to display
             metadata.
             """
-            return f"{self.date} / ({self.state[0:9]}...)"
+            name = self._name
+            if name is None:
+                name = self._name = f"{self.date} / ({self.state[0:9]}...)"
+            return name
 
         def __repr__(self) -> str:
             return f"""
@@ -39,8 +120,8 @@ class Originator:
     def __init__(self, state: str) -> None:
 
         self._state = state
-        print(f"Originator: My initial state is: {self._state}")
-        self.restored: List[Originator.Snapshot] = []
+        log.debug("Originator: My initial state is: %s", self._state)
+        self.restored: Deque[Originator.Snapshot] = deque(maxlen=MAX_UNDO)
 
     def do_something(self) -> None:
         """
@@ -49,13 +130,13 @@ class Originator:
         of the business logic via the save() method.
         """
 
-        print("Originator: I'm doing something important.")
+        log.debug("Originator: I'm doing something important.")
         self._state = self._generate_random_string(5)
-        print(f"Originator: and my state has changed to: {self._state}")
+        log.debug("Originator: and my state has changed to: %s", self._state)
 
     @staticmethod
     def _generate_random_string(length: int = 10) -> str:
-        return "".join(sample(ascii_letters, length))
+        return _random_letters(length)
 
     def save(self) -> Snapshot:
         """
@@ -64,15 +145,15 @@ class Originator:
         if self._state is None:
             raise AttributeError
 
-        return Originator.Snapshot(self._state)
+        return Originator.Snapshot.acquire(self._state)
 
     def restore(self, snapshot: Snapshot) -> None:
         """
         Restores the Originator's state from a memento object.
         """
         self._state = snapshot.state
-        print(f"Originator: My state has changed to: {self._state}")
-        self.restored.append(snapshot)
+        log.debug("Originator: My state has changed to: %s", self._state)
+        _push(self.restored, snapshot)
 
 
 class Caretaker:
@@ -82,35 +163,37 @@ class Caretaker:
     It works with all mementos via the base Memento interface.
     """
 
+    __slots__ = ('_history', '_originator')
+
     def __init__(self, originator: Originator) -> None:
-        self._history: List[Originator.Snapshot] = []
+        self._history: Deque[Originator.Snapshot] = deque(maxlen=MAX_UNDO)
         self._originator = originator
 
     def backup(self) -> None:
-        print("\nCaretaker: Saving Originator's state...")
+        log.debug("\nCaretaker: Saving Originator's state...")
         m = self._originator.save()
-        self._history.append(m)
+        _push(self._history, m)
 
     def undo(self) -> None:
-        if not len(self._history):
+        if not self._history:
+            log.warning('Cannot undo')
             return
 
-        try:
-            snapshot = self._history.pop()
-            print(f"Caretaker: Restoring state to: {snapshot.name}")
+        snapshot = self._history.pop()
+        log.debug("Caretaker: Restoring state to: %s", snapshot.name)
 
-            self._originator.restore(snapshot)
-        except Exception:
-            print('Cannot undo')
+        self._originator.restore(snapshot)
 
     def redo(self) -> None:
-        try:
-            snapshot = self._originator.restored.pop()
-            print(f"Caretaker: Unrestoring state to: {snapshot.name}")
-            self._history.append(snapshot)
-            print(f"Caretaker: Received memento: {snapshot}")
-        except Exception:
-            print('Cannot redo')
+        restored = self._originator.restored
+        if not restored:
+            log.warning('Cannot redo')
+            return
+
+        snapshot = restored.pop()
+        log.debug("Caretaker: Unrestoring state to: %s", snapshot.name)
+        _push(self._history, snapshot)
+        log.debug("Caretaker: Received memento: %s", snapshot)
 
     def show_history(self) -> None:
         print("Caretaker: Here's the list of mementos:")
@@ -119,6 +202,10 @@ class Caretaker:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG, format="%(message)s", stream=sys.stdout
+    )
+
     originator = Originator("Super-duper-super-puper-super.")
     caretaker = Caretaker(originator)
 
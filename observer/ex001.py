@@ -1,72 +1,261 @@
-from abc import ABC, abstractmethod
+import logging
+import sys
+from array import array
+from itertools import compress
+from operator import itemgetter, lt
+from typing import (
+    Any, Dict, List, Optional, Protocol, Sequence, Tuple
+)
+from weakref import WeakMethod
 
+log = logging.getLogger(__name__)
 
-class Observer(ABC):
-    @abstractmethod
-    def update(self, product_name: str, new_stock: int) -> None:
-        pass
+# Stock levels and thresholds are stored as unsigned 16-bit ints, so each
+# value must lie in 0..STOCK_MAX. Levels are checked before any column is
+# written, so a rejected value never leaves the columns out of step.
+STOCK_TYPECODE = 'H'
+STOCK_MAX = 65535
 
 
-class Subject(ABC):
-    @abstractmethod
+def _check_level(value: int) -> None:
+    if not 0 <= value <= STOCK_MAX:
+        raise ValueError(f"stock level {value} is outside 0..{STOCK_MAX}")
+
+
+class StockEvent:
+    """
+    A stock drop, built once per notification and shared by every observer.
+    """
+
+    __slots__ = ('product', 'stock')
+
+    def __init__(self, product: str, stock: int) -> None:
+        self.product = product
+        self.stock = stock
+
+
+class Observer(Protocol):
+    def update(self, event: StockEvent) -> None:
+        ...
+
+
+class Subject(Protocol):
     def attach(self, observer: Observer) -> None:
-        pass
+        ...
 
-    @abstractmethod
     def detach(self, observer: Observer) -> None:
-        pass
+        ...
 
-    @abstractmethod
     def notify(self, product_name, new_stock) -> None:
-        pass
+        ...
 
 
-class StoreManager(Observer):
+class StoreManager:
+    __slots__ = ('_name', '__weakref__')
+
     def __init__(self, name: str):
         self._name = name
 
-    def update(self, product_name: str, new_stock: int) -> None:
-        print(
-            f"{self._name} notify: the stock level for "
-            f"the product has {product_name} gone below the "
-            "threshold and the manager has been notified"
+    def update(self, event: StockEvent) -> None:
+        log.debug(
+            "%s notify: the stock level for "
+            "the product has %s gone below the "
+            "threshold and the manager has been notified",
+            self._name, event.product,
         )
 
 
-class Inventory(Subject):
+class _ObserverList:
+    """
+    Subscribers kept in a list that stays safe to iterate while observers
+    attach or detach in the middle of a notification. Detaching leaves a
+    None tombstone instead of shifting the list, so no copy is needed to
+    iterate. Callers walk the list by index between begin() and end(), so
+    no iterator is allocated per notification. Tombstones are compacted
+    away once they fill a quarter of the list and no walk is in progress.
+    """
+
+    __slots__ = ('_entries', '_index', '_dead', '_iterating')
+
+    def __init__(self) -> None:
+        self._entries: List[Any] = []
+        self._index: Dict[int, int] = {}
+        self._dead = 0
+        self._iterating = 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def begin(self) -> List[Any]:
+        # Pin the entries for an index-based walk; until end() no compaction
+        # runs, so indices stay valid and new entries are only appended
+        self._iterating += 1
+        return self._entries
+
+    def end(self) -> None:
+        self._iterating -= 1
+        self._compact()
+
+    def add(self, key: int, entry: Any) -> None:
+        i = self._index.get(key)
+        if i is not None:
+            self._entries[i] = entry
+            return
+        self._index[key] = len(self._entries)
+        self._entries.append(entry)
+
+    def discard(self, key: int) -> None:
+        i = self._index.pop(key, None)
+        if i is None:
+            return
+        self._entries[i] = None
+        self._dead += 1
+        self._compact()
+
+    def _compact(self) -> None:
+        if self._iterating or self._dead * 4 <= len(self._entries):
+            return
+        entries = self._entries
+        live = sorted(self._index.items(), key=itemgetter(1))
+        self._entries = [entries[i] for _, i in live]
+        self._index = {key: n for n, (key, _) in enumerate(live)}
+        self._dead = 0
+
+
+class Inventory:
     def __init__(self):
-        self._observers = []
-        self._products = {}
+        # Weak references to the bound update() methods, keyed by
+        # id(observer) and resolved once at attach time. The inventory
+        # doesn't keep observers alive; a collected observer drops out of
+        # the list on its own.
+        self._observers = _ObserverList()
+        # Products are stored column-wise: a name -> row index plus parallel
+        # typed arrays, so batch checks run over flat C arrays
+        self._names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._stocks = array(STOCK_TYPECODE)
+        self._thresholds = array(STOCK_TYPECODE)
+        self._deferred: Optional[Dict[str, int]] = None
 
     def attach(self, observer: Observer) -> None:
-        self._observers.append(observer)
+        key = id(observer)
+        observers = self._observers
+        observers.add(
+            key, WeakMethod(observer.update, lambda _: observers.discard(key))
+        )
 
     def detach(self, observer: Observer) -> None:
-        self._observers.remove(observer)
+        self._observers.discard(id(observer))
 
     def notify(self, product_name, new_stock) -> None:
         # TODO: Implement the notify method to notify all observers
-        for observer in self._observers:
-            observer.update(product_name, new_stock)
+        event = StockEvent(product_name, new_stock)
+        observers = self._observers
+        entries = observers.begin()
+        try:
+            i = 0
+            while i < len(entries):
+                ref = entries[i]
+                i += 1
+                if ref is not None:
+                    update = ref()
+                    if update is not None:
+                        update(event)
+        finally:
+            observers.end()
+
+    def disable_updates(self) -> None:
+        # Stop notifying and remember, for every product updated from now
+        # on, its level before the first update. enable_updates() then
+        # notifies once per product whose current level ended up lower.
+        if self._deferred is None:
+            self._deferred = {}
+
+    def enable_updates(self) -> None:
+        deferred = self._deferred
+        self._deferred = None
+        if deferred:
+            index = self._index
+            stocks = self._stocks
+            for product_name, before in deferred.items():
+                new_stock = stocks[index[product_name]]
+                if new_stock < before:
+                    self.notify(product_name, new_stock)
+
+    def add_product(
+        self, product_name: str, stock: int, threshold: int = 0
+    ) -> None:
+        _check_level(stock)
+        _check_level(threshold)
+        i = self._index.get(product_name)
+        if i is not None:
+            self._stocks[i] = stock
+            self._thresholds[i] = threshold
+            return
+        self._index[product_name] = len(self._names)
+        self._names.append(product_name)
+        self._stocks.append(stock)
+        self._thresholds.append(threshold)
+
+    def check_all_below_threshold(self) -> List[str]:
+        return list(compress(
+            self._names, map(lt, self._stocks, self._thresholds)
+        ))
 
     def update_stock(self, product_name: str, new_stock: int) -> None:
         # TODO: Implement the update_stock method to update the stock
         # level and call notify if necessary
-        before = self._products[product_name]
-        self._products[product_name] = new_stock
+        _check_level(new_stock)
+        i = self._index[product_name]
+        before = self._stocks[i]
+        self._stocks[i] = new_stock
+        if self._deferred is not None:
+            self._deferred.setdefault(product_name, before)
+            return
         if new_stock < before:
             self.notify(product_name, new_stock)
 
+    def update_stock_bulk(
+        self, product_names: Sequence[str], new_stocks: Sequence[int]
+    ) -> None:
+        # Resolve and validate the whole batch first, so an unknown product
+        # or out-of-range level rejects it before any stock is changed
+        index = self._index
+        rows: List[Tuple[str, int, int]] = []
+        for product_name, new_stock in zip(product_names, new_stocks):
+            _check_level(new_stock)
+            rows.append((product_name, index[product_name], new_stock))
+
+        # Then apply it in one tight pass and notify for the drops afterwards
+        stocks = self._stocks
+        deferred = self._deferred
+        if deferred is not None:
+            for product_name, i, new_stock in rows:
+                deferred.setdefault(product_name, stocks[i])
+                stocks[i] = new_stock
+            return
+
+        drops: List[Tuple[str, int]] = []
+        for product_name, i, new_stock in rows:
+            if new_stock < stocks[i]:
+                drops.append((product_name, new_stock))
+            stocks[i] = new_stock
+
+        for product_name, new_stock in drops:
+            self.notify(product_name, new_stock)
+
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG, format="%(message)s", stream=sys.stdout
+    )
+
     inventory = Inventory()
 
     # Adding products to inventory
-    inventory._products = {
-        "Apples": 10,
-        "Oranges": 25,
-        "Bananas": 50,
-    }
+    inventory.add_product("Apples", 10)
+    inventory.add_product("Oranges", 25)
+    inventory.add_product("Bananas", 50)
 
     manager1 = StoreManager("Alice")
     manager2 = StoreManager("Bob")
@@ -1,7 +1,14 @@
 from __future__ import annotations
-from abc import ABC, abstractmethod
+import logging
+import sys
+from operator import itemgetter
 from random import randrange
-from typing import Any, List, Optional
+from typing import (
+    Any, Callable, Dict, List, Optional, Protocol, Tuple
+)
+from weakref import WeakMethod
+
+log = logging.getLogger(__name__)
 
 
 """
@@ -115,71 +122,192 @@ object, only a distributed set of observers.
 """
 
 
-class Subject(ABC):
+class Subject(Protocol):
     _state: Any
     """
     The Subject interface declares a set of methods for managing subscribers.
     """
 
-    @abstractmethod
     def attach(self, observer: Observer) -> None:
         """
         Attach an observer to the subject.
         """
-        pass
+        ...
 
-    @abstractmethod
     def detach(self, observer: Observer) -> None:
         """
         Detach an observer from the subject.
         """
-        pass
+        ...
 
-    @abstractmethod
-    def notify(self) -> None:
+    def notify(self, max_level: int = 0) -> None:
         """
         Notify all observers about an event.
         """
-        pass
+        ...
+
+
+Predicate = Callable[[Subject], bool]
 
 
-class ConcreteSubject(Subject):
+class _ObserverList:
+    """
+    Subscribers kept in a list that stays safe to iterate while observers
+    attach or detach in the middle of a notification. Detaching leaves a
+    None tombstone instead of shifting the list, so no copy is needed to
+    iterate. Callers walk the list by index between begin() and end(), so
+    no iterator is allocated per notification. Tombstones are compacted
+    away once they fill a quarter of the list and no walk is in progress.
+    """
+
+    __slots__ = ('_entries', '_index', '_dead', '_iterating')
+
+    def __init__(self) -> None:
+        self._entries: List[Any] = []
+        self._index: Dict[int, int] = {}
+        self._dead = 0
+        self._iterating = 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def begin(self) -> List[Any]:
+        # Pin the entries for an index-based walk; until end() no compaction
+        # runs, so indices stay valid and new entries are only appended
+        self._iterating += 1
+        return self._entries
+
+    def end(self) -> None:
+        self._iterating -= 1
+        self._compact()
+
+    def add(self, key: int, entry: Any) -> None:
+        i = self._index.get(key)
+        if i is not None:
+            self._entries[i] = entry
+            return
+        self._index[key] = len(self._entries)
+        self._entries.append(entry)
+
+    def discard(self, key: int) -> None:
+        i = self._index.pop(key, None)
+        if i is None:
+            return
+        self._entries[i] = None
+        self._dead += 1
+        self._compact()
+
+    def _compact(self) -> None:
+        if self._iterating or self._dead * 4 <= len(self._entries):
+            return
+        entries = self._entries
+        live = sorted(self._index.items(), key=itemgetter(1))
+        self._entries = [entries[i] for _, i in live]
+        self._index = {key: n for n, (key, _) in enumerate(live)}
+        self._dead = 0
+
+
+class ConcreteSubject:
     """
     The Subject owns some important state and notifies observers when the state
     changes.
     """
 
-    _state: Optional[int] = None
+    __slots__ = ('_state', '_buckets', '_bucket_at', '_levels')
+
+    _state: Optional[int]
     """
     For the sake of simplicity, the Subject's state, essential to all
     subscribers, is stored in this variable.
     """
 
-    _observers: List[Observer] = []
+    _buckets: List[Tuple[int, _ObserverList]]
     """
-    List of subscribers. In real life, the list of subscribers can be stored
-    more comprehensively (categorized by event type, etc.).
+    Subscribers categorized by notification level. Each bucket holds
+    (update, predicate) pairs keyed by id(), so attaching and detaching don't
+    scan a list, and notify() only visits the levels it was asked for. The
+    bound update() method is stored rather than the observer, so notifying
+    skips the attribute lookup. It is held through a weak reference, so the
+    subject never keeps an observer alive; collected observers detach
+    themselves. Buckets are only ever appended, which keeps them safe to
+    walk while observers attach mid-notify.
     """
 
-    def attach(self, observer: Observer) -> None:
-        print("Subject: Attached an observer.")
-        self._observers.append(observer)
+    _bucket_at: Dict[int, _ObserverList]
+    """
+    The bucket for each level, for attach() and detach().
+    """
+
+    _levels: Dict[int, int]
+    """
+    The level each subscriber was attached at, keyed by id().
+    """
+
+    def __init__(self) -> None:
+        self._state = None
+        self._buckets = []
+        self._bucket_at = {}
+        self._levels = {}
+
+    def attach(
+        self,
+        observer: Observer,
+        level: int = 0,
+        predicate: Optional[Predicate] = None,
+    ) -> None:
+        log.debug("Subject: Attached an observer.")
+        if predicate is None:
+            predicate = getattr(observer, "accepts", None)
+        key = id(observer)
+        self.detach(observer)
+        levels = self._levels
+        levels[key] = level
+        bucket = self._bucket_at.get(level)
+        if bucket is None:
+            bucket = self._bucket_at[level] = _ObserverList()
+            self._buckets.append((level, bucket))
+
+        def forget(_: WeakMethod) -> None:
+            if levels.pop(key, None) is not None:
+                bucket.discard(key)
+
+        bucket.add(key, (WeakMethod(observer.update, forget), predicate))
 
     def detach(self, observer: Observer) -> None:
-        self._observers.remove(observer)
+        key = id(observer)
+        level = self._levels.pop(key, None)
+        if level is not None:
+            self._bucket_at[level].discard(key)
 
     """
     The subscription management methods.
     """
 
-    def notify(self) -> None:
+    def notify(self, max_level: int = 0) -> None:
         """
-        Trigger an update in each subscriber.
+        Trigger an update in each subscriber attached at or below max_level
+        whose predicate accepts the current state.
         """
 
-        print("Subject: Notifying observers...")
-        for observer in self._observers:
-            observer.update(self)
+        log.debug("Subject: Notifying observers...")
+        for level, bucket in self._buckets:
+            if level > max_level:
+                continue
+            entries = bucket.begin()
+            try:
+                i = 0
+                while i < len(entries):
+                    entry = entries[i]
+                    i += 1
+                    if entry is None:
+                        continue
+                    ref, predicate = entry
+                    if predicate is None or predicate(self):
+                        update = ref()
+                        if update is not None:
+                            update(self)
+            finally:
+                bucket.end()
 
     def some_business_logic(self) -> None:
         """
@@ -190,24 +318,25 @@ class ConcreteSubject(Subject):
         happen (or after it).
         """
 
-        print("\nSubject: I'm doing something important.")
+        log.debug("\nSubject: I'm doing something important.")
         self._state = randrange(0, 10)
 
-        print(f"Subject: My state has just changed to: {self._state}")
+        log.debug("Subject: My state has just changed to: %s", self._state)
         self.notify()
 
 
-class Observer(ABC):
+class Observer(Protocol):
     """
     The Observer interface declares the update method, used by subjects.
+    An observer may also declare an accepts() predicate so the subject can
+    skip it for states it doesn't care about.
     """
 
-    @abstractmethod
     def update(self, subject: Subject) -> None:
         """
         Receive update from subject.
         """
-        pass
+        ...
 
 
 """
@@ -216,20 +345,33 @@ attached to.
 """
 
 
-class ConcreteObserverA(Observer):
+class ConcreteObserverA:
+    __slots__ = ('__weakref__',)
+
+    @staticmethod
+    def accepts(subject: Subject) -> bool:
+        return subject._state < 3
+
     def update(self, subject: Subject) -> None:
-        if subject._state < 3:
-            print("ConcreteObserverA: Reacted to the event")
+        log.debug("ConcreteObserverA: Reacted to the event")
+
+
+class ConcreteObserverB:
+    __slots__ = ('__weakref__',)
 
+    @staticmethod
+    def accepts(subject: Subject) -> bool:
+        return subject._state == 0 or subject._state >= 2
 
-class ConcreteObserverB(Observer):
     def update(self, subject: Subject) -> None:
-        if subject._state == 0 or subject._state >= 2:
-            print("ConcreteObserverB: Reacted to the event")
+        log.debug("ConcreteObserverB: Reacted to the event")
 
 
 if __name__ == "__main__":
     # The client code.
+    logging.basicConfig(
+        level=logging.DEBUG, format="%(message)s", stream=sys.stdout
+    )
 
     subject = ConcreteSubject()
 
@@ -1,4 +1,5 @@
 import copy
+from dataclasses import dataclass, fields
 
 
 """
@@ -213,18 +214,61 @@ class SelfReferencingEntity:
         self.parent = parent
 
 
+# Fields annotated with one of these types can't be changed in place, so a
+# deep copy shares them instead of copying.
+_IMMUTABLE = (int, float, complex, str, bytes, bool, type(None), frozenset)
+
+
+def _unrolled_deepcopy(cls):
+    """
+    Give a dataclass a `__deepcopy__` generated from its field list, the way
+    `dataclasses` itself generates `__init__`: one assignment per field, with
+    no loop over the fields at copy time.
+
+    What is the use of the argument `memo`? Memo is the dictionary that is
+    used by the `deepcopy` library to prevent infinite recursive copies in
+    instances of circular references. The generated method registers the
+    clone in `memo` before copying any field, so nested objects that point
+    back at the original resolve to the clone instead of triggering a second
+    copy. Fields annotated with an immutable type are shared, not copied.
+    """
+    lines = [
+        "def __deepcopy__(self, memo=None):",
+        "    if memo is None:",
+        "        memo = {}",
+        "    cls = type(self)",
+        "    new = cls.__new__(cls)",
+        "    memo[id(self)] = new",
+    ]
+    for field in fields(cls):
+        name = field.name
+        if field.type in _IMMUTABLE:
+            lines.append(f"    new.{name} = self.{name}")
+        else:
+            lines.append(f"    new.{name} = _deepcopy(self.{name}, memo)")
+    lines.append("    return new")
+
+    namespace = {"_deepcopy": copy.deepcopy}
+    exec("\n".join(lines), namespace)
+    deepcopy = namespace["__deepcopy__"]
+    deepcopy.__qualname__ = f"{cls.__qualname__}.__deepcopy__"
+    cls.__deepcopy__ = deepcopy
+    return cls
+
+
+@_unrolled_deepcopy
+@dataclass(slots=True, eq=False)
 class SomeComponent:
     """
     Python provides its own interface of Prototype via `copy.copy` and
     `copy.deepcopy` functions. And any class that wants to implement custom
     implementations have to override `__copy__` and `__deepcopy__` member
-    functions.
+    functions. Here `__deepcopy__` is generated by `_unrolled_deepcopy`.
     """
 
-    def __init__(self, some_int, some_list_of_objects, some_circular_ref):
-        self.some_int = some_int
-        self.some_list_of_objects = some_list_of_objects
-        self.some_circular_ref = some_circular_ref
+    some_int: int
+    some_list_of_objects: list
+    some_circular_ref: SelfReferencingEntity
 
     def __copy__(self):
         """
@@ -233,44 +277,15 @@ class SomeComponent:
         as the new shallow copy.
         """
 
-        # First, let's create copies of the nested objects.
-        some_list_of_objects = copy.copy(self.some_list_of_objects)
-        some_circular_ref = copy.copy(self.some_circular_ref)
+        # First, let's create the clone itself without going through
+        # `__init__`, so each field below is stored exactly once.
+        cls = self.__class__
+        new = cls.__new__(cls)
 
-        # Then, let's clone the object itself, using the prepared clones of the
-        # nested objects.
-        new = self.__class__(
-            self.some_int, some_list_of_objects, some_circular_ref
-        )
-        new.__dict__.update(self.__dict__)
-
-        return new
-
-    def __deepcopy__(self, memo=None):
-        """
-        Create a deep copy. This method will be called whenever someone calls
-        `copy.deepcopy` with this object and the returned value is returned as
-        the new deep copy.
-
-        What is the use of the argument `memo`? Memo is the dictionary that is
-        used by the `deepcopy` library to prevent infinite recursive copies in
-        instances of circular references. Pass it to all the `deepcopy` calls
-        you make in the `__deepcopy__` implementation to prevent infinite
-        recursions.
-        """
-        if memo is None:
-            memo = {}
-
-        # First, let's create copies of the nested objects.
-        some_list_of_objects = copy.deepcopy(self.some_list_of_objects, memo)
-        some_circular_ref = copy.deepcopy(self.some_circular_ref, memo)
-
-        # Then, let's clone the object itself, using the prepared clones of the
-        # nested objects.
-        new = self.__class__(
-            self.some_int, some_list_of_objects, some_circular_ref
-        )
-        new.__dict__ = copy.deepcopy(self.__dict__, memo)
+        # Then, let's fill it with copies of the nested objects.
+        new.some_int = self.some_int
+        new.some_list_of_objects = copy.copy(self.some_list_of_objects)
+        new.some_circular_ref = copy.copy(self.some_circular_ref)
 
         return new
 
@@ -5,11 +5,13 @@ class SingletonMeta(type):
     _instances: Dict[Any, Any] = {}
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
+        # A single lookup on the hit path; a stored instance is never None
+        instance = cls._instances.get(cls)
+        if instance is None:
             instance = super().__call__(*args, **kwargs)
             cls._instances[cls] = instance
 
-        return cls._instances[cls]
+        return instance
 
 
 class Singleton2(metaclass=SingletonMeta):
@@ -1,4 +1,5 @@
 
+import random
 from typing import Any, Dict
 
 
@@ -20,7 +21,6 @@ class SingletonMetaEagerLoading(type):
 
 class SingletonEager(metaclass=SingletonMetaEagerLoading):
     def __init__(self):
-        import random
         self.a = random.randint(1, 100)
         self.b = random.randint(1, 100)
 
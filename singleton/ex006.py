@@ -7,9 +7,13 @@ class ThreadingSingleton:
     _lock = Lock()
 
     def __new__(cls):
-        with cls._lock:
-            if not cls._instance:
-                cls._instance = super().__new__(cls)
+        # Double-checked: once the instance exists it is returned without
+        # touching the lock; the second check covers a thread that created
+        # it while this one was waiting
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
 
@@ -1,14 +1,17 @@
-import random
+from random import randint
 
 
 def singleton(func):
-    instances = {}
-    print(instances)
+    # Only one function is ever wrapped, so its result lives in the closure
+    # itself; a sentinel marks "not called yet" since func may return None
+    sentinel = object()
+    result = sentinel
 
     def get_instance(*args, **kwargs):
-        if func not in instances:
-            instances[func] = func(*args, **kwargs)
-        return instances[func]
+        nonlocal result
+        if result is sentinel:
+            result = func(*args, **kwargs)
+        return result
 
     return get_instance
 
@@ -17,7 +20,7 @@ def singleton(func):
 def get_config():
     return {
         "host": "localhost",
-        "port": random.randint(10, 100)
+        "port": randint(10, 100)
     }
 
 
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import NamedTuple, Annotated
+from typing import Annotated, Dict, NamedTuple, Tuple
+import sys
 import time
 
 
@@ -89,13 +90,27 @@ between concrete states, letting them alter the state of the context at will.
 
 
 class Baseclass:
-    def __str__(self):
-        cls = type(self)
-        return f'{cls.__name__}({vars(self)})'
+    __slots__ = ()
+
+    # Filled in per subclass by __init_subclass__, so __repr__ neither walks
+    # the MRO nor looks the class name up on every call
+    _name = 'Baseclass'
+    _field_names: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._name = cls.__name__
+        cls._field_names = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get('__slots__', ())
+        )
 
     def __repr__(self):
-        cls = type(self)
-        return f'{cls.__name__}({vars(self)})'
+        fields = {name: getattr(self, name) for name in self._field_names}
+        return '%s(%r)' % (self._name, fields)
+
+    __str__ = __repr__
 
 
 class Color(NamedTuple):
@@ -104,19 +119,36 @@ class Color(NamedTuple):
     b: Annotated[int, "0 to 255"]
 
     def __add__(self, color: 'Color') -> 'Color':  # type: ignore
-        return Color(self.r + color.r, self.g + color.g, self.b + color.b)
+        # Channels saturate at 255. Colors are immutable, so each distinct
+        # sum is built once (tuple.__new__ skips the keyword handling of the
+        # generated __new__) and handed out again from the cache afterwards
+        key = (
+            min(self.r + color.r, 255),
+            min(self.g + color.g, 255),
+            min(self.b + color.b, 255),
+        )
+        result = _COLOR_CACHE.get(key)
+        if result is None:
+            result = _COLOR_CACHE[key] = tuple.__new__(Color, key)
+        return result
+
+
+_COLOR_CACHE: Dict[Tuple[int, int, int], Color] = {}
 
 
 red = Color(r=255, g=0, b=0)
 green = Color(r=0, g=255, b=0)
 blue = Color(r=0, g=0, b=255)
 
+# The mixed colors never change, so they are computed once at import time
 yellow = red + green
 cian = green + blue
 magenta = blue + red
 
 
 class TrafficLight(Baseclass):
+    __slots__ = ('state',)
+
     def __init__(self, state: 'TrafficLightState'):
         self.state = state
 
@@ -127,14 +159,15 @@ class TrafficLight(Baseclass):
         self.state = state
 
     def get_color(self):
-        return self.state.get_color()
+        return self.state.color
 
 
 class TrafficLightState(ABC, Baseclass):
+    __slots__ = ()
 
-    @abstractmethod
-    def get_color(self) -> Color:
-        raise NotImplementedError
+    # Each state shows a fixed color, so it is a class attribute rather
+    # than a method to call
+    color: Color
 
     @abstractmethod
     def next(self, light: TrafficLight) -> None:
@@ -142,62 +175,61 @@ class TrafficLightState(ABC, Baseclass):
 
 
 class GreenState(TrafficLightState):
-    _instance = None
+    __slots__ = ()
 
-    @classmethod
-    def get_instance(cls):
-        if cls._instance is not None:
-            return cls._instance
-        instance = cls.__new__(cls)
-        cls._instance = instance
-        return instance
-
-    def get_color(self) -> Color:
-        return green
+    color = green
 
     def next(self, light: 'TrafficLight') -> None:
-        light.state = YellowState.get_instance()
+        light.state = YELLOW
 
 
 class YellowState(TrafficLightState):
-    _instance = None
-
-    @classmethod
-    def get_instance(cls):
-        if cls._instance is not None:
-            return cls._instance
-        instance = cls.__new__(cls)
-        cls._instance = instance
-        return instance
+    __slots__ = ()
 
-    def get_color(self) -> Color:
-        return yellow
+    color = yellow
 
     def next(self, light: 'TrafficLight') -> None:
-        light.state = RedState.get_instance()
+        light.state = RED
 
 
 class RedState(TrafficLightState):
+    __slots__ = ()
 
-    _instance = None
-
-    @classmethod
-    def get_instance(cls):
-        if cls._instance is not None:
-            return cls._instance
-        instance = cls.__new__(cls)
-        cls._instance = instance
-        return instance
-
-    def get_color(self) -> Color:
-        return red
+    color = red
 
     def next(self, light: 'TrafficLight') -> None:
-        light.state = GreenState.get_instance()
-
-
-traffic_light = TrafficLight(GreenState())
-while True:
-    traffic_light.next()
-    print(traffic_light)
-    time.sleep(2)
+        light.state = GREEN
+
+
+# The states hold no data, so one instance of each is built here and every
+# transition just rebinds light.state to it.
+GREEN = GreenState.__new__(GreenState)
+YELLOW = YellowState.__new__(YellowState)
+RED = RedState.__new__(RedState)
+
+GreenState.instance = GREEN
+YellowState.instance = YELLOW
+RedState.instance = RED
+
+
+def run(light: TrafficLight, n_cycles: int) -> None:
+    # Transitions only, no printing or sleeping, so the state switching
+    # itself can be timed and profiled
+    for _ in range(n_cycles):
+        light.next()
+
+
+if __name__ == "__main__":
+    traffic_light = TrafficLight(GREEN)
+    if len(sys.argv) > 1:
+        # python ex001.py N runs N transitions as fast as possible
+        n_cycles = int(sys.argv[1])
+        start = time.perf_counter()
+        run(traffic_light, n_cycles)
+        elapsed = time.perf_counter() - start
+        print(f'{n_cycles} transitions in {elapsed:.3f}s')
+    else:
+        while True:
+            traffic_light.next()
+            print(traffic_light)
+            time.sleep(2)
@@ -1,101 +1,64 @@
-from abc import ABC, abstractmethod
+from typing import Dict, Tuple
 
 
-# Step 1: Define the abstract base class TicketState
-class TicketState(ABC):
-    _instance = None
-    ticket: 'Ticket'
+# Step 1: Define the ticket states and the actions that move between them.
+# The states carry no behaviour of their own, so they are plain ints and the
+# whole state machine is data: a lookup on (state, action) replaces a method
+# dispatch through a state object.
+NEW, ASSIGNED, RESOLVED, CLOSED = range(4)
+ASSIGN, RESOLVE, CLOSE = range(3)
 
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
+_STATE_NAMES = ('NewState', 'AssignedState', 'ResolvedState', 'ClosedState')
 
-        return cls._instance
 
-    @abstractmethod
-    def assign(self, ticket: 'Ticket') -> 'TicketState':
-        pass
+# Step 2: Describe the transitions. Every (state, action) pair is either a
+# move to another state or a message explaining why the action is refused.
+_TRANSITIONS: Dict[Tuple[int, int], int] = {
+    (NEW, ASSIGN): ASSIGNED,
+    (NEW, CLOSE): CLOSED,
+    (ASSIGNED, RESOLVE): RESOLVED,
+    (ASSIGNED, CLOSE): CLOSED,
+    (RESOLVED, CLOSE): CLOSED,
+}
 
-    @abstractmethod
-    def resolve(self, ticket: 'Ticket') -> 'TicketState':
-        pass
-
-    @abstractmethod
-    def close(self, ticket: 'Ticket') -> 'TicketState':
-        pass
-
-    def __str__(self):
-        cls = type(self)
-        return f'{{  {cls.__name__}  }}'
-
-
-# Step 2: Implement the concrete state classes
-class NewState(TicketState):
-    def assign(self, ticket: 'Ticket'):
-        ticket.state = AssignedState()
-
-    def resolve(self, ticket: 'Ticket'):
-        print('Não dá: ticket precisa ser atribuído')
-
-    def close(self, ticket: 'Ticket'):
-        ticket.state = ClosedState()
-
-
-class AssignedState(TicketState):
-    def assign(self, ticket: 'Ticket'):
-        print('Já está atribuído!')
-
-    def resolve(self, ticket: 'Ticket'):
-        ticket.state = ResolvedState()
-
-    def close(self, ticket: 'Ticket'):
-        ticket.state = ClosedState()
-
-
-class ResolvedState(TicketState):
-    def assign(self, ticket: 'Ticket'):
-        print("Não dá: Ticket já resolvido")
-
-    def resolve(self, ticket: 'Ticket'):
-        print("O ticket já está resolvido")
-
-    def close(self, ticket: 'Ticket'):
-        ticket.state = ClosedState()
-
-
-class ClosedState(TicketState):
-    def assign(self, ticket: 'Ticket'):
-        print("Não dá: Ticket já fechado")
-
-    def resolve(self, ticket: 'Ticket'):
-        print("Não dá: Ticket já fechado")
-
-    def close(self, ticket: 'Ticket'):
-        print("Não dá: Ticket já fechado")
+_REFUSALS: Dict[Tuple[int, int], str] = {
+    (NEW, RESOLVE): 'Não dá: ticket precisa ser atribuído',
+    (ASSIGNED, ASSIGN): 'Já está atribuído!',
+    (RESOLVED, ASSIGN): "Não dá: Ticket já resolvido",
+    (RESOLVED, RESOLVE): "O ticket já está resolvido",
+    (CLOSED, ASSIGN): "Não dá: Ticket já fechado",
+    (CLOSED, RESOLVE): "Não dá: Ticket já fechado",
+    (CLOSED, CLOSE): "Não dá: Ticket já fechado",
+}
 
 
 # Step 3: Implement the Ticket class
 class Ticket:
+    __slots__ = ('state',)
 
     def __init__(self) -> None:
-        self.state: TicketState = NewState()
-        # print(self)
+        self.state = NEW
+
+    def _apply(self, action: int) -> None:
+        key = (self.state, action)
+        state = _TRANSITIONS.get(key)
+        if state is None:
+            print(_REFUSALS[key])
+            return
+        self.state = state
 
     def assign(self):
-        self.state.assign(self)
-        # print(self)
+        self._apply(ASSIGN)
 
     def resolve(self):
-        self.state.resolve(self)
-        # print(self)
+        self._apply(RESOLVE)
 
     def close(self):
-        self.state.close(self)
-        # print(self)
+        self._apply(CLOSE)
 
     def __str__(self):
         cls = type(self)
-        return f'{cls.__name__}{self.state}'
+        return f'{cls.__name__}{{  {_STATE_NAMES[self.state]}  }}'
 
 
 # Step 4: Test the behavior of the ticket and its state transitions
@@ -1,58 +1,49 @@
-# Define an abstract base class called TicketState
-class TicketState:
-    def assign(self, t):
-        pass
-
-    def resolve(self, t):
-        pass
-
-    def close(self, t):
-        pass
-
-
-# Implement concrete state classes for each of the ticket states
-class NewState(TicketState):
-    def assign(self, ticket):
-        print("Ticket is now assigned.")
-        return AssignedState()
-
-
-class AssignedState(TicketState):
-    def resolve(self, ticket):
-        print("Ticket is now resolved.")
-        return ResolvedState()
-
-
-class ResolvedState(TicketState):
-    def close(self, ticket):
-        print("Ticket is now closed.")
-        return ClosedState()
-
-
-class ClosedState(TicketState):
-    def assign(self, ticket: 'Ticket'):
-        pass
-
-    def resolve(self, ticket: 'Ticket'):
-        pass
-
-    def close(self, ticket: 'Ticket'):
-        pass
+# Define the ticket states and the events that can be applied to a ticket.
+# The states carry no data, so a ticket's state is just an int and every
+# transition is a lookup in the tables below.
+NEW, ASSIGNED, RESOLVED, CLOSED = 0, 1, 2, 3
+EV_ASSIGN, EV_RESOLVE, EV_CLOSE = 0, 1, 2
+
+# TRANSITIONS[state][event] is the next state; an event that isn't valid in
+# a state leaves it unchanged
+TRANSITIONS = (
+    (ASSIGNED, NEW, NEW),
+    (ASSIGNED, RESOLVED, ASSIGNED),
+    (RESOLVED, RESOLVED, CLOSED),
+    (CLOSED, CLOSED, CLOSED),
+)
+
+# MESSAGES[state][event] is printed when that event changes the state
+MESSAGES = (
+    ("Ticket is now assigned.", None, None),
+    (None, "Ticket is now resolved.", None),
+    (None, None, "Ticket is now closed."),
+    (None, None, None),
+)
 
 
 # Implement a Ticket class to manage state transitions
 class Ticket:
+    __slots__ = ('state',)
+
     def __init__(self) -> None:
-        self.state: TicketState = NewState()
+        self.state = NEW
+
+    def _fire(self, event: int) -> None:
+        state = self.state
+        nxt = TRANSITIONS[state][event]
+        if nxt != state:
+            print(MESSAGES[state][event])
+            self.state = nxt
 
-    def assign(self):
-        self.state.assign(self)
+    def assign(self) -> None:
+        self._fire(EV_ASSIGN)
 
-    def resolve(self):
-        self.state.resolve(self)
+    def resolve(self) -> None:
+        self._fire(EV_RESOLVE)
 
-    def close(self):
-        self.state.close(self)
+    def close(self) -> None:
+        self._fire(EV_CLOSE)
 
 
 # Step 4: Test the behavior of the ticket and its state transitions
@@ -109,75 +109,93 @@ state of the context at will.
 """
 
 
-from abc import ABC, abstractmethod
+import math
+from array import array
+from typing import Callable, Dict, List
 
 
-# Step 1: Create the DiscountStrategy interface
-class DiscountStrategy(ABC):
-
-    @abstractmethod
-    def apply_discount(self, total: float) -> float:
-        pass
+# Step 1: Define the discount strategy type. A strategy holds no state
+# beyond its parameters, so it is a plain callable taking the cart total
+# instead of an object with a single method.
+DiscountStrategy = Callable[[float], float]
 
 
 # Step 2: Implement the discount strategies
-class NoDiscount(DiscountStrategy):
-    def __init__(self):
-        pass
-
-    def apply_discount(self, total: float) -> float:
-        return total
+def no_discount(total: float) -> float:
+    return total
 
 
-class PercentageDiscount(DiscountStrategy):
-    def __init__(self, value):
-        self.value = value
+def percentage_discount(value: float) -> DiscountStrategy:
+    # The multiplier is worked out once, when the strategy is created
+    factor = 1 - value / 100
 
-    def apply_discount(self, total: float) -> float:
-        r = total - self.value/100 * total
-        return r
+    def apply_discount(total: float) -> float:
+        return total * factor
 
+    return apply_discount
 
-class FixedAmountDiscount(DiscountStrategy):
-    def __init__(self, value):
-        self.value = value
 
-    def apply_discount(self, total: float) -> float:
-        r = total - self.value
-        return r
+def fixed_amount_discount(value: float) -> DiscountStrategy:
+    def apply_discount(total: float) -> float:
+        return total - value
 
+    return apply_discount
 
-# TODO: Implement NoDiscount, PercentageDiscount,
-# and FixedAmountDiscount classes
 
 # Step 3: Implement the ShoppingCart class
 class ShoppingCart:
+    __slots__ = ('discount_fn', '_names', '_prices')
 
-    def __init__(self, discount_strategy):
-        # TODO: Initialize the shopping cart with the given discount_strategy
+    def __init__(self, discount_fn: DiscountStrategy) -> None:
+        # TODO: Initialize the shopping cart with the given discount_fn
         # and an empty items dictionary
-        self.discount_strategy = discount_strategy
-        self.items = {}
+        self.discount_fn = discount_fn
+        # Items are stored column-wise: names in a list and prices in a
+        # parallel array of C doubles, rather than a dict per cart
+        self._names: List[str] = []
+        self._prices = array('d')
 
-    def add_item(self, item: str, price: float):
+    def add_item(self, item: str, price: float) -> None:
         # TODO: Add the item with its price to the items dictionary
-        self.items[item] = price
-
-    def remove_item(self, item: str):
+        names = self._names
+        if item in names:
+            self._prices[names.index(item)] = price
+            return
+        names.append(item)
+        self._prices.append(price)
+
+    def remove_item(self, item: str) -> None:
         # TODO: Remove the item from the items dictionary if it exists
-        self.items.pop(item, None)
+        names = self._names
+        if item not in names:
+            return
+        i = names.index(item)
+        del names[i]
+        del self._prices[i]
+
+    @property
+    def items(self) -> Dict[str, float]:
+        return dict(zip(self._names, self._prices))
 
     def get_total(self) -> float:
-        return sum(list(self.items.values()))
+        # Summed on demand with fsum over the contiguous price array; a
+        # running total would drift as items are added and removed
+        return math.fsum(self._prices)
 
     def get_total_after_discount(self) -> float:
-        return self.discount_strategy.apply_discount(self.get_total())
+        # no_discount is a single module-level function, so the common
+        # no-discount case is an identity check instead of a call
+        total = self.get_total()
+        discount_fn = self.discount_fn
+        if discount_fn is no_discount:
+            return total
+        return discount_fn(total)
 
 
 # Step 4: Test your implementation
 if __name__ == "__main__":
     # TODO: Create a shopping cart with a discount strategy
-    cart = ShoppingCart(FixedAmountDiscount(10))
+    cart = ShoppingCart(fixed_amount_discount(10))
 
     # TODO: Add a few items
     cart.add_item("Item 1", 10.0)
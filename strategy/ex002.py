@@ -1,51 +1,79 @@
-from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Protocol
 import json
 import csv
+import os
+from functools import lru_cache
 from xml.etree import ElementTree as ET
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is used without it
+    orjson = None
 
-# Step 1: Create the FileParser interface
-class FileParser(ABC):
 
-    @abstractmethod
+# Step 1: Create the FileParser interface. It is a Protocol, so the parsers
+# below match it structurally and don't inherit from it.
+class FileParser(Protocol):
     def parse_file(self, file_path: str) -> List[Dict[str, Any]]:
-        pass
+        ...
+
 
 # Step 2: Implement the file parsers
 # TODO: Implement CSVParser, JSONParser, and XMLParser classes
 
 
-class CSVParser(FileParser):
+class CSVParser:
     def parse_file(self, file_path: str) -> List[Dict[str, Any]]:
-        result = []
-        with open(file_path) as f:
-            csv_reader = list(csv.reader(f))
-            for row in csv_reader[1:]:
-                result.append({
-                    csv_reader[0][0]: row[0],
-                    csv_reader[0][1]: row[1],
-                    csv_reader[0][2]: row[2],
-                })
+        with open(file_path, newline='') as f:
+            return list(csv.DictReader(f))
 
-        return result
+    def parse_file_iter(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        # The header row becomes the keys; rows are read one at a time
+        with open(file_path, newline='') as f:
+            yield from csv.DictReader(f)
 
 
-class JSONParser(FileParser):
+class JSONParser:
     def parse_file(self, file_path: str) -> List[Dict[str, Any]]:
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
         with open(file_path) as f:
             return json.load(f)
 
 
-class XMLParser(FileParser):
+class XMLParser:
     def parse_file(self, file_path: str) -> List[Dict[str, Any]]:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        result = []
-        for element in root:
-            result.append(element.attrib)
-
-        return result
+        return list(self.parse_file_iter(file_path))
+
+    def parse_file_iter(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        # Stream the document instead of building the whole tree: once a
+        # child of the root has been read, the root is cleared so the child
+        # is dropped and memory stays bounded by a single element
+        root = None
+        depth = 0
+        for event, element in ET.iterparse(file_path, events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = element
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1:
+                attrib = dict(element.attrib)
+                root.clear()
+                yield attrib
+
+
+@lru_cache(maxsize=32)
+def _parse_cached(
+    parser_type: type, file_path: str, mtime_ns: int, size: int
+) -> List[Dict[str, Any]]:
+    # The parsers hold no state, so the cache is keyed on the parser's class:
+    # every instance shares its entries and none is kept alive by the cache.
+    # mtime_ns and size are only part of the key, so a file that changes on
+    # disk is parsed again instead of served stale
+    return parser_type().parse_file(file_path)
 
 
 # Step 3: Implement the FileReader class
@@ -58,7 +86,20 @@ class FileReader:
     def read_file(self, file_path: str) -> List[Dict[str, Any]]:
         # TODO: Read the file at the given file_path and return a list of
         # dictionaries using the specified file parser
-        return self.file_parser.parse_file(file_path)
+        # Repeated reads of an unchanged file return the same cached list,
+        # so callers must not mutate it
+        stat = os.stat(file_path)
+        return _parse_cached(
+            type(self.file_parser), file_path, stat.st_mtime_ns, stat.st_size
+        )
+
+    def iter_file(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        # Parsers that can stream provide parse_file_iter to yield one record
+        # at a time; the others are parsed whole and walked afterwards
+        parse_file_iter = getattr(self.file_parser, 'parse_file_iter', None)
+        if parse_file_iter is not None:
+            return parse_file_iter(file_path)
+        return iter(self.file_parser.parse_file(file_path))
 
 
 # Step 4: Test your implementation
@@ -3,31 +3,49 @@ import json
 import csv
 from xml.etree import ElementTree as ET
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is used without it
+    orjson = None
+
 
 Payload = List[Dict[str, Any]]
 
 
 def parse_csv_file(file_path: str) -> Payload:
-    with open(file_path) as f:
-        csv_reader = list(csv.reader(f))
-        return [{
-            csv_reader[0][0]: row[0],
-            csv_reader[0][1]: row[1],
-            csv_reader[0][2]: row[2],
-        } for row in csv_reader[1:]]
+    with open(file_path, newline='') as f:
+        rows = csv.reader(f)
+        header = next(rows, None)
+        if header is None:
+            return []
+        return [dict(zip(header, row)) for row in rows]
 
 
 def parse_json_file(file_path: str) -> Payload:
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
     with open(file_path) as f:
         return json.load(f)
 
 
 def parse_xml_file(file_path: str) -> Payload:
-    tree = ET.parse(file_path)
-    root = tree.getroot()
+    # Stream the document instead of building the whole tree: once a child
+    # of the root has been read, the root is cleared so the child is dropped
+    # and memory stays bounded by a single element
     result = []
-    for element in root:
-        result.append(element.attrib)
+    root = None
+    depth = 0
+    for event, element in ET.iterparse(file_path, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = element
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1:
+            result.append(dict(element.attrib))
+            root.clear()
 
     return result
 
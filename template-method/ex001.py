@@ -63,17 +63,92 @@ Strategy works on the object level, letting you switch behaviors at runtime.
 """
 
 
-from abc import ABC, abstractmethod
-
+from abc import ABCMeta, abstractmethod
+
+
+_BASE_OPERATION1 = "AbstractClass says: I am doing the bulk of the work"
+_BASE_OPERATION2 = (
+    "AbstractClass says: But I let subclasses override some operations"
+)
+_BASE_OPERATION3 = (
+    "AbstractClass says: But I am doing the bulk of the work anyway"
+)
+
+# The steps of the template method, in order.
+_STEPS = (
+    'base_operation1',
+    'required_operations1',
+    'base_operation2',
+    'hook1',
+    'required_operations2',
+    'base_operation3',
+    'hook2',
+)
+
+
+class TemplateMeta(ABCMeta):
+    """
+    Generates a `template_method` specialised for each concrete subclass.
+    Steps the subclass inherits unchanged are inlined: the base operations
+    become bare prints and the empty default hooks are left out. Only the
+    steps the subclass implements itself remain method calls.
+
+    The steps are read when the class is created, so replacing a hook or
+    base operation on the class afterwards (e.g. with `mock.patch.object`)
+    has no effect on the generated method. A class that overrides
+    `template_method` itself, and its subclasses, keep that override.
+    """
 
-class AbstractClass(ABC):
+    def __init__(cls, name, bases, namespace, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        if cls.__abstractmethods__:
+            return
+        current = cls.template_method
+        if not (
+            current is AbstractClass.template_method
+            or getattr(current, '_generated', False)
+        ):
+            return
+
+        inlined = {
+            AbstractClass.base_operation1: "print(_BASE_OPERATION1)",
+            AbstractClass.base_operation2: "print(_BASE_OPERATION2)",
+            AbstractClass.base_operation3: "print(_BASE_OPERATION3)",
+            AbstractClass.hook1: None,
+            AbstractClass.hook2: None,
+        }
+        lines = ["def template_method(self) -> None:"]
+        for step in _STEPS:
+            func = getattr(cls, step)
+            if func in inlined:
+                code = inlined[func]
+                if code is not None:
+                    lines.append(f"    {code}")
+            else:
+                lines.append(f"    self.{step}()")
+
+        namespace = {
+            "_BASE_OPERATION1": _BASE_OPERATION1,
+            "_BASE_OPERATION2": _BASE_OPERATION2,
+            "_BASE_OPERATION3": _BASE_OPERATION3,
+        }
+        exec("\n".join(lines), namespace)
+        template_method = namespace["template_method"]
+        template_method.__qualname__ = f"{cls.__qualname__}.template_method"
+        template_method.__doc__ = AbstractClass.template_method.__doc__
+        template_method._generated = True
+        cls.template_method = template_method
+
+
+class AbstractClass(metaclass=TemplateMeta):
     """
     The Abstract Class defines a template method that contains a skeleton of
     some algorithm, composed of calls to (usually) abstract primitive
     operations.
 
     Concrete subclasses should implement these operations, but leave the
-    template method itself intact.
+    template method itself intact. Each concrete subclass gets its own
+    copy of the template method, generated by `TemplateMeta`.
     """
 
     def template_method(self) -> None:
@@ -92,14 +167,13 @@ class AbstractClass(ABC):
     # These operations already have implementations.
 
     def base_operation1(self) -> None:
-        print("AbstractClass says: I am doing the bulk of the work")
+        print(_BASE_OPERATION1)
 
     def base_operation2(self) -> None:
-        print("AbstractClass says: But I let subclasses "
-              "override some operations")
+        print(_BASE_OPERATION2)
 
     def base_operation3(self) -> None:
-        print("AbstractClass says: But I am doing the bulk of the work anyway")
+        print(_BASE_OPERATION3)
 
     # These operations have to be implemented in subclasses.
 
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from array import array
 from typing import Iterator
 
 
@@ -6,6 +7,18 @@ class GameAI(ABC):
     # O método template define o esqueleto de um algoritmo.
     built_structures: Iterator
 
+    def __init__(self):
+        # O rendimento de cada estrutura fica num array paralelo, então a
+        # coleta é uma única soma em C em vez de uma chamada por estrutura.
+        self.resources = 0
+        self._yields = array('l')
+        # Resultados dos ganchos closest_enemy/map_center, reaproveitados
+        # entre turnos até que enemies_moved()/map_changed() os invalidem.
+        self._enemy = None
+        self._enemy_version = 0
+        self._enemy_seen = -1
+        self._map_center = None
+
     def turn(self):
         self.collect_resources()
         self.build_structures()
@@ -16,9 +29,11 @@ class GameAI(ABC):
     def collect_resources(self):
         print('Collecting')
         print(self.built_structures)
-        for s in self.built_structures:
-            print('collecting: ', s)
-            s.collect()
+        self.resources += sum(self._yields)
+
+    def add_structure_yield(self, amount):
+        # Chamado por build_structures ao construir uma estrutura.
+        self._yields.append(amount)
 
     # E alguns deles podem ser definidos como abstratos.
     @abstractmethod
@@ -29,14 +44,32 @@ class GameAI(ABC):
     def build_units(self):
         pass
 
+    def enemies_moved(self):
+        self._enemy_version += 1
+
+    def map_changed(self):
+        self._map_center = None
+
+    def _cached_closest_enemy(self):
+        if self._enemy_seen != self._enemy_version:
+            self._enemy = self.closest_enemy()
+            self._enemy_seen = self._enemy_version
+        return self._enemy
+
+    def _cached_map_center(self):
+        center = self._map_center
+        if center is None:
+            center = self._map_center = self.map_center()
+        return center
+
     # Uma classe pode ter vários métodos template.
     def attack(self):
         print('Attacking')
-        enemy = self.closest_enemy()
-        if enemy is None:
-            self.send_scouts(self.map_center())
-        else:
+        enemy = self._cached_closest_enemy()
+        if enemy is not None:
             self.send_warriors(enemy.position)
+        else:
+            self.send_scouts(self._cached_map_center())
 
     @abstractmethod
     def send_scouts(self, position):
@@ -55,13 +88,25 @@ class GameAI(ABC):
         pass
 
 
+# Estruturas dos orcs, na ordem de construção, com o rendimento de cada uma.
+_ORC_STRUCTURES = (('fazenda', 5), ('quartel', 2), ('fortaleza', 10))
+
+
 # Classes concretas precisam implementar todas as operações abstratas da
 # classe base mas não devem sobrescrever o próprio método template.
 class OrcsAI(GameAI):
+    def __init__(self):
+        super().__init__()
+        self._structures = []
+
     def build_structures(self):
         if self.there_are_some_resources():
             # Construir fazendas, depois quartéis, depois fortaleza.
-            pass
+            built = len(self._structures)
+            if built < len(_ORC_STRUCTURES):
+                name, amount = _ORC_STRUCTURES[built]
+                self._structures.append(name)
+                self.add_structure_yield(amount)
 
     def build_units(self):
         if self.there_are_plenty_of_resources():
@@ -103,7 +148,7 @@ class OrcsAI(GameAI):
     @property
     def built_structures(self):
         # Devolver estruturas construídas.
-        return []
+        return self._structures
 
     @property
     def scouts(self):